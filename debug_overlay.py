@@ -56,7 +56,7 @@ def debug_overlay_issue():
     # Start media playback for testing
     media_objects = media_player.get_media_objects()
     if media_objects:
-        first_media_id = list(media_objects.keys())[0]
+        first_media_id = next(iter(media_objects))
         print(f"DEBUG: Starting playback of: {first_media_id}")
 
         try:
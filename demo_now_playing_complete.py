@@ -63,7 +63,7 @@ def demonstrate_now_playing_functionality():
     # Scenario 2: Start playing media
     media_objects = media_player.get_media_objects()
     if media_objects:
-        first_media_id = list(media_objects.keys())[0]
+        first_media_id = next(iter(media_objects))
         media_obj = media_objects[first_media_id]
 
         print(f"\n2. STARTING PLAYBACK: {media_obj.name}")
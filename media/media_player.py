@@ -59,6 +59,9 @@ class MediaPlayer:
         # Callback for when media objects change (for StreamDeck etc.)
         self.media_change_callbacks = []
 
+        # Callback for when playback state or volume changes (for the TUI etc.)
+        self.status_change_callbacks = []
+
         # Load media from configuration and filesystem
         self._load_media()
 
@@ -145,6 +148,12 @@ class MediaPlayer:
 
     def play_media(self, media_id: str, track_number: int = 1) -> bool:
         """Play a media object (radio station or album)"""
+        result = self._play_media(media_id, track_number)
+        self._notify_status_change()
+        return result
+
+    def _play_media(self, media_id: str, track_number: int) -> bool:
+        """Start playback of a media object without notifying callbacks"""
         if media_id not in self.media_objects:
             self.player_core.error_message = f"Media '{media_id}' not found"
             self.player_core.state = PlayerState.ERROR
@@ -153,7 +162,7 @@ class MediaPlayer:
         media_obj = self.media_objects[media_id]
 
         # Stop all current playback
-        self.stop()
+        self._stop()
 
         self.player_core.state = PlayerState.LOADING
         self.player_core.error_message = None
@@ -179,6 +188,12 @@ class MediaPlayer:
     # Playback controls
     def stop(self) -> bool:
         """Stop all playback"""
+        result = self._stop()
+        self._notify_status_change()
+        return result
+
+    def _stop(self) -> bool:
+        """Stop all managers and the core player without notifying callbacks"""
         try:
             # Stop all managers
             radio_result = self.radio_manager.stop()
@@ -197,6 +212,12 @@ class MediaPlayer:
 
     def pause(self) -> bool:
         """Pause current playback"""
+        result = self._pause()
+        self._notify_status_change()
+        return result
+
+    def _pause(self) -> bool:
+        """Pause whichever manager is playing without notifying callbacks"""
         try:
             # Check which manager is currently playing and pause it
             if self.radio_manager.is_playing_station():
@@ -215,6 +236,12 @@ class MediaPlayer:
 
     def resume(self) -> bool:
         """Resume current playback"""
+        result = self._resume()
+        self._notify_status_change()
+        return result
+
+    def _resume(self) -> bool:
+        """Resume whichever manager is paused without notifying callbacks"""
         try:
             # Check which manager has paused content and resume it
             if self.radio_manager.get_current_station():
@@ -233,7 +260,9 @@ class MediaPlayer:
 
     def set_volume(self, volume: float) -> bool:
         """Set volume (0.0 to 1.0)"""
-        return self.player_core.set_volume(volume)
+        result = self.player_core.set_volume(volume)
+        self._notify_status_change()
+        return result
 
     def get_volume(self) -> float:
         """Get current volume"""
@@ -242,19 +271,23 @@ class MediaPlayer:
     # Album-specific controls
     def next_track(self) -> bool:
         """Skip to next track in current album or Sonos queue"""
+        result = False
         if self.album_manager.is_playing_album():
-            return self.album_manager.next_track()
+            result = self.album_manager.next_track()
         elif self.sonos_manager and self.sonos_manager.is_playing_favorite():
-            return self.sonos_manager.next_track()
-        return False
+            result = self.sonos_manager.next_track()
+        self._notify_status_change()
+        return result
 
     def previous_track(self) -> bool:
         """Go to previous track in current album or Sonos queue"""
+        result = False
         if self.album_manager.is_playing_album():
-            return self.album_manager.previous_track()
+            result = self.album_manager.previous_track()
         elif self.sonos_manager and self.sonos_manager.is_playing_favorite():
-            return self.sonos_manager.previous_track()
-        return False
+            result = self.sonos_manager.previous_track()
+        self._notify_status_change()
+        return result
 
     # Status and information
     def get_status(self) -> PlayerStatus:
@@ -355,6 +388,14 @@ class MediaPlayer:
 
         return result
 
+    def get_sonos_media_objects(self) -> Dict[str, MediaObject]:
+        """Get the Sonos favorite media objects"""
+        return {
+            mid: obj
+            for mid, obj in self.media_objects.items()
+            if mid.startswith("sonos_")
+        }
+
     def get_sonos_speaker_info(self) -> Optional[dict]:
         """Get information about the connected Sonos speaker"""
         if not self.sonos_manager:
@@ -416,3 +457,23 @@ class MediaPlayer:
                 callback()
             except Exception as e:
                 logger.error(f"Error in media change callback: {e}")
+
+    def add_status_change_callback(self, callback):
+        """Add a callback to be called with the new status after playback changes"""
+        self.status_change_callbacks.append(callback)
+
+    def remove_status_change_callback(self, callback):
+        """Remove a status change callback"""
+        if callback in self.status_change_callbacks:
+            self.status_change_callbacks.remove(callback)
+
+    def _notify_status_change(self):
+        """Notify all callbacks of the current player status"""
+        if not self.status_change_callbacks:
+            return
+        status = self.get_status()
+        for callback in self.status_change_callbacks:
+            try:
+                callback(status)
+            except Exception as e:
+                logger.error(f"Error in status change callback: {e}")
@@ -8,6 +8,7 @@ import logging
 import os
 import hashlib
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
 try:
@@ -27,6 +28,9 @@ from .player_core import VLCPlayerCore
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent album art downloads when building media objects
+ALBUM_ART_DOWNLOAD_WORKERS = 8
+
 
 class SonosManager:
     """Manages Sonos speaker integration and favorites"""
@@ -94,7 +98,7 @@ class SonosManager:
                 if SOCO_AVAILABLE and soco:
                     devices = soco.discover()
                     if devices:
-                        self.device = list(devices)[0]
+                        self.device = next(iter(devices))
                         self.speaker_ip = self.device.ip_address
                         logger.info(
                             f"Discovered and connected to Sonos speaker at {self.speaker_ip}"
@@ -166,6 +170,30 @@ class SonosManager:
             logger.warning(f"Failed to download album art from {album_art_uri}: {e}")
             return None
 
+    def _download_album_art_batch(
+        self, album_art_uris: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Download album art for several favorites concurrently
+
+        Takes a mapping of favorite ID to album art URI and returns a mapping
+        of favorite ID to cached image path for the downloads that succeeded.
+        """
+        if not album_art_uris:
+            return {}
+
+        workers = min(ALBUM_ART_DOWNLOAD_WORKERS, len(album_art_uris))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                favorite_id: executor.submit(self._download_album_art, uri, favorite_id)
+                for favorite_id, uri in album_art_uris.items()
+            }
+
+        return {
+            favorite_id: path
+            for favorite_id, future in futures.items()
+            if (path := future.result())
+        }
+
     def create_media_objects(self) -> Dict[str, MediaObject]:
         """Create MediaObject instances for all Sonos favorites"""
         media_objects = {}
@@ -173,6 +201,8 @@ class SonosManager:
         if not self.device or not self.favorites:
             return media_objects
 
+        pending_album_art: Dict[str, str] = {}
+
         for i, favorite in enumerate(self.favorites):
             # Get the title safely - it might be a property or method
             try:
@@ -200,17 +230,11 @@ class SonosManager:
             except Exception:
                 uri = ""
 
-            # Get album art URI and download/cache it
-            album_art_path = ""
+            # Queue album art for download; it is fetched in one batch below
             if self.album_art_enabled:
                 try:
                     if hasattr(favorite, "album_art_uri") and favorite.album_art_uri:
-                        album_art_path = (
-                            self._download_album_art(
-                                favorite.album_art_uri, favorite_id
-                            )
-                            or ""
-                        )
+                        pending_album_art[favorite_id] = favorite.album_art_uri
                 except Exception as e:
                     logger.debug(f"Failed to get album art for {title}: {e}")
 
@@ -221,12 +245,17 @@ class SonosManager:
                 media_type=MediaType.SONOS,
                 path=uri,
                 description=f"Sonos Favorite: {title}",
-                image_path=album_art_path,  # Now includes actual album art path
             )
 
             media_objects[favorite_id] = media_object
             logger.debug(f"Created media object for Sonos favorite: {favorite.title}")
 
+        # Attach downloaded/cached album art to the media objects
+        for favorite_id, album_art_path in self._download_album_art_batch(
+            pending_album_art
+        ).items():
+            media_objects[favorite_id].image_path = album_art_path
+
         return media_objects
 
     def play_favorite(self, media_obj: MediaObject) -> bool:
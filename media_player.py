@@ -103,6 +103,14 @@ class MediaPlayer:
         """Get current player status"""
         return self._player.get_status()
 
+    def add_status_change_callback(self, callback):
+        """Add a callback to be called with the new status after playback changes"""
+        self._player.add_status_change_callback(callback)
+
+    def remove_status_change_callback(self, callback):
+        """Remove a status change callback"""
+        self._player.remove_status_change_callback(callback)
+
     # Spotify functionality (removed - kept for backward compatibility)
     def search_spotify_albums(self, query: str, limit: int = 10) -> List[Dict]:
         """Search for Spotify albums - DEPRECATED: Spotify integration removed"""
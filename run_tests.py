@@ -87,8 +87,12 @@ def run_all_tests(verbose=False, coverage=False, include_hardware=False):
     if coverage:
         cmd.extend(["--cov=.", "--cov-report=term-missing", "--cov-report=html"])
     
-    if not include_hardware:
-        cmd.extend(["-m", "not hardware"])
+    # An explicit -m replaces the pytest.ini default, so integration tests run;
+    # benchmarks stay out since they need a serial run (see --benchmark)
+    if include_hardware:
+        cmd.extend(["-m", "not benchmark"])
+    else:
+        cmd.extend(["-m", "not hardware and not benchmark"])
     
     return run_command(cmd, "Running all tests")
 
@@ -135,9 +139,29 @@ def run_legacy_tests():
     return all(success for _, success in results)
 
 
+def run_smoke_tests(verbose=False):
+    """Run the import smoke tests"""
+    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "smoke"]
+    
+    if verbose:
+        cmd.append("-v")
+    
+    return run_command(cmd, "Running smoke tests")
+
+
+def run_benchmarks(verbose=False):
+    """Run performance benchmarks serially so timings are not skewed by xdist"""
+    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "benchmark", "-n", "0", "--dist", "no"]
+    
+    if verbose:
+        cmd.append("-v")
+    
+    return run_command(cmd, "Running benchmarks")
+
+
 def check_test_coverage():
     """Generate and display test coverage report"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "--cov=.", "--cov-report=html", "--cov-report=term"]
+    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "not benchmark", "--cov=.", "--cov-report=html", "--cov-report=term"]
     return run_command(cmd, "Generating coverage report")
 
 
@@ -161,7 +185,9 @@ def main():
     parser.add_argument("--api", action="store_true", help="Run API tests only")
     parser.add_argument("--streamdeck", action="store_true", help="Run StreamDeck tests only")
     parser.add_argument("--fast", action="store_true", help="Run fast tests only")
+    parser.add_argument("--smoke", action="store_true", help="Run import smoke tests only")
     parser.add_argument("--legacy", action="store_true", help="Run legacy test scripts")
+    parser.add_argument("--benchmark", action="store_true", help="Run performance benchmarks")
     parser.add_argument("--coverage", action="store_true", help="Generate coverage report")
     parser.add_argument("--lint", action="store_true", help="Lint test files")
     parser.add_argument("--hardware", action="store_true", help="Include hardware tests")
@@ -189,8 +215,12 @@ def main():
         success &= run_streamdeck_tests(args.verbose, args.hardware)
     elif args.fast:
         success &= run_fast_tests(args.verbose)
+    elif args.smoke:
+        success &= run_smoke_tests(args.verbose)
     elif args.legacy:
         success &= run_legacy_tests()
+    elif args.benchmark:
+        success &= run_benchmarks(args.verbose)
     elif args.coverage:
         success &= check_test_coverage()
     elif args.lint:
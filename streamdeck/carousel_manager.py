@@ -56,6 +56,7 @@ class CarouselManager:
 
         # Get media objects from configuration
         config_media_objects = self.config_manager.get_media_objects()
+        player_media_objects = self.media_player.get_media_objects()
 
         # Build list of available media objects in configured order
         for media_obj in config_media_objects:
@@ -65,11 +66,11 @@ class CarouselManager:
                 continue
 
             # Only add if the media player has this object
-            if media_id in self.media_player.get_media_objects():
+            if media_id in player_media_objects:
                 self.all_media_objects.append(media_id)
 
         # Add all media objects from media player (includes local albums and Sonos favorites)
-        for media_id, media_obj in self.media_player.get_media_objects().items():
+        for media_id, media_obj in player_media_objects.items():
             if media_id not in self.all_media_objects:
                 # Add albums and Sonos favorites
                 if media_obj.media_type in [MediaType.ALBUM, MediaType.SONOS]:
@@ -52,7 +52,7 @@ def test_sonos_integration():
 
             if sonos_media:
                 # Test playing the first favorite
-                first_favorite_id = list(sonos_media.keys())[0]
+                first_favorite_id = next(iter(sonos_media))
                 first_favorite = sonos_media[first_favorite_id]
 
                 logger.info(f"Testing playback of: {first_favorite.name}")
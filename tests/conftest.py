@@ -2,103 +2,219 @@
 Pytest configuration and fixtures for radio-streamer tests
 """
 
-import os
-import tempfile
+import copy
+import functools
+import json
+import sys
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, MagicMock, patch
 from typing import Dict, Any
 
-# Add project root to path for imports
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary config file for testing"""
-    config_data = {
-        "stations": {
-            "test_station": {
-                "name": "Test Station",
-                "url": "http://example.com/stream.mp3",
-                "description": "Test station for testing",
-            }
-        },
-        "ui": {
-            "font_settings": {
-                "font_size_range": [12, 24],
-                "max_text_length": 12,
-                "truncate_suffix": "...",
-            }
-        },
-        "streamdeck": {
-            "brightness": 50,
-            "update_interval": 0.5,
-            "carousel": {
-                "infinite_wrap": True,
-                "auto_reset_seconds": 30,
-                "default_position": 0,
-            },
+import media
+import media.player_core
+import media_player
+from media import DOTENV_AVAILABLE, VLC_AVAILABLE
+from media.types import MediaType
+from media_config_manager import MediaConfigManager
+from tests.fakes import make_fake_vlc_module
+
+# Availability flags are resolved at import time; check them once per session
+assert isinstance(VLC_AVAILABLE, bool) and isinstance(DOTENV_AVAILABLE, bool)
+
+try:
+    import vlc
+except ImportError:
+    vlc = None
+
+try:
+    from StreamDeck.Devices.StreamDeck import StreamDeck
+except ImportError:
+    StreamDeck = None
+
+
+def first(iterable, default=None):
+    """Return the first item of an iterable without materialising it"""
+    return next(iter(iterable), default)
+
+
+@functools.cache
+def media_type_values() -> frozenset:
+    """Return the set of MediaType values, computed once per session"""
+    return frozenset(mt.value for mt in MediaType)
+
+
+# Shared configuration written by the config file fixtures
+TEST_CONFIG = {
+    "stations": {
+        "test_station": {
+            "name": "Test Station",
+            "url": "http://example.com/stream.mp3",
+            "description": "Test station for testing",
+        }
+    },
+    "ui": {
+        "font_settings": {
+            "font_size_range": [12, 24],
+            "max_text_length": 12,
+            "truncate_suffix": "...",
+        }
+    },
+    "streamdeck": {
+        "brightness": 50,
+        "update_interval": 0.5,
+        "carousel": {
+            "infinite_wrap": True,
+            "auto_reset_seconds": 30,
+            "default_position": 0,
         },
+    },
+    "media_config": {
+        "music_folder": "music",
+        "enable_local_albums": True,
+        "enable_spotify": False,
+        "enable_sonos": False,
+        "sonos_speaker_ip": None,
+        "load_media_objects_file": True,
+    },
+    "colors": {
+        "playing": [0, 150, 0],
+        "loading": [255, 165, 0],
+        "available": [0, 100, 200],
+        "inactive": [50, 50, 50],
+        "error": [150, 0, 0],
+    },
+}
+
+# Config payloads encoded once at import and written verbatim by the fixtures
+TEST_CONFIG_BYTES = json.dumps(TEST_CONFIG).encode("utf-8")
+MINIMAL_CONFIG_BYTES = b'{"stations": {}}'
+LOCAL_ALBUMS_DISABLED_CONFIG_BYTES = json.dumps(
+    {
         "media_config": {
             "music_folder": "music",
-            "enable_local_albums": True,
+            "enable_local_albums": False,
             "enable_spotify": False,
             "enable_sonos": False,
             "sonos_speaker_ip": None,
             "load_media_objects_file": True,
-        },
-        "colors": {
-            "playing": [0, 150, 0],
-            "loading": [255, 165, 0],
-            "available": [0, 100, 200],
-            "inactive": [50, 50, 50],
-            "error": [150, 0, 0],
-        },
+        }
     }
+).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Create a temporary config file shared read-only across the session"""
+    path = tmp_path_factory.mktemp("config") / "config.json"
+    path.write_bytes(TEST_CONFIG_BYTES)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def invalid_json_file(tmp_path_factory):
+    """Read-only config file containing malformed JSON"""
+    path = tmp_path_factory.mktemp("config") / "invalid.json"
+    path.write_text("invalid json content {")
+    return str(path)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        import json
 
-        json.dump(config_data, f)
-        temp_file = f.name
+@pytest.fixture(scope="session")
+def minimal_config_file(tmp_path_factory):
+    """Read-only config file with an empty stations section and nothing else"""
+    path = tmp_path_factory.mktemp("config") / "minimal.json"
+    path.write_bytes(MINIMAL_CONFIG_BYTES)
+    return str(path)
 
-    yield temp_file
 
-    # Cleanup
-    if os.path.exists(temp_file):
-        os.unlink(temp_file)
+@pytest.fixture(scope="session")
+def local_albums_disabled_config_file(tmp_path_factory):
+    """Read-only config file with enable_local_albums turned off"""
+    path = tmp_path_factory.mktemp("config") / "local_albums_disabled.json"
+    path.write_bytes(LOCAL_ALBUMS_DISABLED_CONFIG_BYTES)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def _base_config_manager(tmp_path_factory):
+    """MediaConfigManager parsed once per module from TEST_CONFIG"""
+    config_dir = tmp_path_factory.mktemp("config")
+    config_file = config_dir / "config.json"
+    config_file.write_bytes(TEST_CONFIG_BYTES)
+    return MediaConfigManager(str(config_file), str(config_dir / "media_objects.json"))
 
 
 @pytest.fixture
-def temp_music_folder():
-    """Create a temporary music folder with test albums"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create test album structure
-        album_dir = os.path.join(temp_dir, "Test Album")
-        os.makedirs(album_dir)
+def ro_config_manager(_base_config_manager):
+    """Module-wide MediaConfigManager shared by read-only tests
 
-        # Create dummy audio files
-        for i in range(3):
-            track_file = os.path.join(album_dir, f"0{i + 1} - Track {i + 1}.mp3")
-            with open(track_file, "w") as f:
-                f.write("dummy audio content")
+    Tests using this fixture must not add, remove or save anything; use
+    config_manager for tests that mutate state.
+    """
+    return _base_config_manager
 
-        yield temp_dir
+
+@pytest.fixture
+def config_manager(_base_config_manager, tmp_path):
+    """Per-test MediaConfigManager cloned from the module-wide parsed copy
+
+    Skips re-reading the config from disk; saves go to the test's tmp_path.
+    """
+    manager = copy.copy(_base_config_manager)
+    manager.config = copy.deepcopy(_base_config_manager.config)
+    manager.media_objects = copy.deepcopy(_base_config_manager.media_objects)
+    manager.config_file = tmp_path / "config.json"
+    manager.media_objects_file = tmp_path / "media_objects.json"
+    return manager
+
+
+@pytest.fixture(scope="session")
+def temp_music_folder(tmp_path_factory):
+    """Create a temporary music folder with test albums, shared read-only"""
+    temp_dir = tmp_path_factory.mktemp("music")
+
+    # Create test album structure
+    album_dir = temp_dir / "Test Album"
+    album_dir.mkdir()
+
+    # Create dummy audio files
+    for i in range(3):
+        track_file = album_dir / f"0{i + 1} - Track {i + 1}.mp3"
+        track_file.write_text("dummy audio content")
+
+    return str(temp_dir)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_vlc():
+    """Swap python-vlc for a plain-Python fake for the whole session
+
+    Tests never need real audio output, and libvlc may not be installed.
+    Tests that assert on VLC calls still patch media.player_core.vlc with
+    their own mocks on top of this.
+    """
+    fake = make_fake_vlc_module()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(sys.modules, "vlc", fake)
+        monkeypatch.setattr(media.player_core, "vlc", fake)
+        monkeypatch.setattr(media.player_core, "VLC_AVAILABLE", True)
+        monkeypatch.setattr(media, "VLC_AVAILABLE", True)
+        monkeypatch.setattr(media_player, "VLC_AVAILABLE", True)
+        yield fake
 
 
 @pytest.fixture
 def mock_vlc():
     """Mock VLC player for testing"""
     mock_vlc = Mock()
-    mock_instance = Mock()
-    mock_media_player = Mock()
+    # Bind to the real VLC classes when available so attribute typos fail
+    mock_instance = Mock(spec=vlc.Instance if vlc else None)
+    mock_media_player = Mock(spec=vlc.MediaPlayer if vlc else None)
 
     # Setup mock hierarchy
     mock_vlc.Instance.return_value = mock_instance
     mock_instance.media_player_new.return_value = mock_media_player
-    mock_instance.media_new.return_value = Mock()
+    mock_instance.media_new.return_value = Mock(spec=vlc.Media if vlc else None)
 
     # Mock player methods
     mock_media_player.set_media = Mock()
@@ -112,10 +228,63 @@ def mock_vlc():
     return mock_vlc
 
 
+# The vlc.Instance methods VLCPlayerCore calls
+VLC_INSTANCE_SPEC = ["media_player_new", "media_new", "release"]
+
+
+def _patch_vlc(monkeypatch):
+    """Point media.player_core at a mock VLC module and return its player"""
+    mock_player = Mock()
+    mock_player.play.return_value = 0
+    mock_player.get_state.return_value = 1  # Stopped
+    mock_player.audio_get_volume.return_value = 50
+
+    mock_instance = Mock(spec=VLC_INSTANCE_SPEC)
+    mock_instance.media_player_new.return_value = mock_player
+    mock_instance.media_new.return_value = Mock()
+
+    mock_vlc_module = Mock()
+    mock_vlc_module.Instance.return_value = mock_instance
+
+    monkeypatch.setattr(media.player_core, "vlc", mock_vlc_module)
+    monkeypatch.setattr(media_player, "VLC_AVAILABLE", True)
+    return mock_player
+
+
+@pytest.fixture
+def vlc_mock(monkeypatch):
+    """Patch VLC for MediaPlayer construction and return the mock player
+
+    Defaults to a stopped player at volume 50; tests needing other states
+    override ``get_state``/``play`` on the returned mock.
+    """
+    return _patch_vlc(monkeypatch)
+
+
+@pytest.fixture(scope="class")
+def stub_player_snapshots(temp_config_file, temp_music_folder):
+    """Media objects and status from a real MediaPlayer, built once per class
+
+    For tests that only need realistic return values to feed a mocked
+    player; the snapshots are shared, so treat them as read-only.
+    """
+    from media_player import MediaPlayer
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _patch_vlc(monkeypatch)
+        player = MediaPlayer(
+            music_folder=temp_music_folder, config_file=temp_config_file
+        )
+        return {
+            "media_objects": player.get_media_objects(),
+            "status": player.get_status(),
+        }
+
+
 @pytest.fixture
 def mock_streamdeck():
     """Mock StreamDeck device for testing"""
-    mock_device = Mock()
+    mock_device = Mock(spec=StreamDeck)
     mock_device.is_open.return_value = True
     mock_device.key_count.return_value = 15
     mock_device.key_image_format.return_value = {
@@ -158,9 +327,9 @@ def sample_radio_station():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_album_data():
-    """Sample album data for testing"""
+    """Sample album data for testing, shared read-only"""
     return {
         "name": "Test Album",
         "folder_name": "test_album",
@@ -182,13 +351,53 @@ def sample_album_data():
     }
 
 
+@pytest.fixture(scope="session")
+def app_instance():
+    """The FastAPI app, imported lazily so only workers that need it pay for it"""
+    from api import app
+
+    return app
+
+
 @pytest.fixture
-def api_client():
+def api_media_player(monkeypatch, app_instance):
+    """Replace the API module's media player with a MagicMock"""
+    import api
+
+    player = MagicMock()
+    monkeypatch.setattr(api, "media_player", player)
+    return player
+
+
+@pytest.fixture
+def api_client(app_instance):
     """Create a test client for the FastAPI app"""
     from fastapi.testclient import TestClient
-    from api import app
 
-    return TestClient(app)
+    return TestClient(app_instance)
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """Session-wide test client for the FastAPI app
+
+    The client and its transport are built once for the whole session
+    instead of once per test.
+    """
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_instance) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(app_instance):
+    """Async test client that drives the FastAPI app in-process over ASGI"""
+    from httpx import ASGITransport, AsyncClient
+
+    transport = ASGITransport(app=app_instance)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 # Skip tests that require hardware
@@ -0,0 +1,161 @@
+"""
+Plain-Python fakes shared by the test suite
+
+These stand in for VLC objects and the player/config collaborators used by
+the StreamDeck components, plus canned player statuses for the API tests. Unlike Mock, they have real methods with fixed
+return values.
+"""
+
+import enum
+import types
+
+from media.types import PlayerState, PlayerStatus
+
+
+class FakeVlcState(enum.IntEnum):
+    """Mirror of vlc.State with libvlc's numbering"""
+
+    NothingSpecial = 0
+    Opening = 1
+    Buffering = 2
+    Playing = 3
+    Paused = 4
+    Stopped = 5
+    Ended = 6
+    Error = 7
+
+
+class FakeVlcMedia:
+    """Plain stand-in for vlc.Media"""
+
+    def __init__(self, mrl=None):
+        self.mrl = mrl
+
+    def release(self):
+        pass
+
+
+class FakeVlcPlayer:
+    """Plain stand-in for vlc.MediaPlayer that tracks state and volume"""
+
+    def __init__(self):
+        self._media = None
+        self._state = FakeVlcState.NothingSpecial
+        self._volume = 100
+
+    def set_media(self, media):
+        self._media = media
+
+    def play(self):
+        self._state = FakeVlcState.Playing
+        return 0
+
+    def pause(self):
+        if self._state == FakeVlcState.Playing:
+            self._state = FakeVlcState.Paused
+        elif self._state == FakeVlcState.Paused:
+            self._state = FakeVlcState.Playing
+
+    def stop(self):
+        self._state = FakeVlcState.Stopped
+
+    def get_state(self):
+        return self._state
+
+    def is_playing(self):
+        return int(self._state == FakeVlcState.Playing)
+
+    def audio_set_volume(self, volume):
+        self._volume = volume
+        return 0
+
+    def audio_get_volume(self):
+        return self._volume
+
+    def release(self):
+        pass
+
+
+class FakeVlcInstance:
+    """Plain stand-in for vlc.Instance"""
+
+    def __init__(self, *args):
+        self.args = args
+
+    def media_player_new(self):
+        return FakeVlcPlayer()
+
+    def media_new(self, mrl):
+        return FakeVlcMedia(mrl)
+
+    def release(self):
+        pass
+
+
+def make_fake_vlc_module():
+    """Build a module object that can stand in for python-vlc"""
+    module = types.ModuleType("vlc")
+    module.Instance = FakeVlcInstance
+    module.MediaPlayer = FakeVlcPlayer
+    module.Media = FakeVlcMedia
+    module.State = FakeVlcState
+    return module
+
+
+class FakeStatus:
+    """Player status with nothing loaded"""
+
+    current_media = None
+    state = "stopped"
+
+
+class FakeMediaPlayer:
+    """Media player with no media objects and nothing playing"""
+
+    def get_media_objects(self):
+        return {}
+
+    def get_media_object(self, media_id):
+        return None
+
+    def get_status(self):
+        return FakeStatus()
+
+
+class FakeConfigManager:
+    """Config manager serving the default StreamDeck UI settings"""
+
+    def get_colors(self):
+        return {
+            "playing": (0, 150, 0),
+            "loading": (255, 165, 0),
+            "available": (0, 100, 200),
+            "inactive": (50, 50, 50),
+            "error": (150, 0, 0),
+        }
+
+    def get_streamdeck_config(self):
+        return {
+            "brightness": 50,
+            "update_interval": 0.5,
+            "carousel": {
+                "infinite_wrap": True,
+                "auto_reset_seconds": 30,
+                "default_position": 0,
+            },
+        }
+
+    def get_ui_config(self):
+        return {
+            "font_settings": {
+                "font_size_range": [12, 24],
+                "max_text_length": 12,
+                "truncate_suffix": "...",
+            }
+        }
+
+    def get_media_objects(self):
+        return []
+
+
+STOPPED_STATUS = PlayerStatus(state=PlayerState.STOPPED, volume=0.5)
@@ -3,20 +3,73 @@ Tests for the FastAPI application
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from dataclasses import dataclass
 import json
 
-from api import app
-from media.types import MediaObject, MediaType, PlayerState, PlayerStatus
+from media.types import MediaObject, MediaType
+from tests.fakes import STOPPED_STATUS
+
+
+@dataclass(frozen=True)
+class TrackDTO:
+    """Data-only stand-in for a track returned by the media player"""
+
+    title: str
+
+
+@dataclass(frozen=True)
+class AlbumDTO:
+    """Data-only stand-in for an album's details"""
+
+    name: str
+    tracks: tuple
+    track_count: int
+
+
+@dataclass(frozen=True)
+class AlbumMediaDTO:
+    """Data-only stand-in for an album media object"""
+
+    id: str
+    name: str
+    media_type: str
+    album: AlbumDTO
+
+
+# Canned media player return values, built once and shared read-only by tests
+CANNED_STATIONS = {
+    "test_radio": MediaObject(
+        id="test_radio",
+        name="Test Radio",
+        media_type=MediaType.RADIO,
+        path="http://example.com/stream.mp3",
+        description="Test station",
+    )
+}
+
+CANNED_ALBUMS = {
+    "test_album": AlbumMediaDTO(
+        id="test_album",
+        name="Test Album",
+        media_type="album",
+        album=AlbumDTO(
+            name="Test Album",
+            tracks=(TrackDTO(title="Track 1"), TrackDTO(title="Track 2")),
+            track_count=2,
+        ),
+    )
+}
+
+
+# Every test talks to the app with its media player swapped for a MagicMock
+pytestmark = pytest.mark.usefixtures("api_media_player")
 
 
 class TestAPIBasics:
     """Test basic API functionality"""
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test the root endpoint"""
-        client = TestClient(app)
         response = client.get("/")
 
         assert response.status_code == 200
@@ -24,37 +77,22 @@ class TestAPIBasics:
         assert "message" in data
         assert "Radio Streamer API" in data["message"]
 
-    def test_health_check(self):
+    @pytest.mark.parametrize("endpoint", ["/health", "/status", "/ping"])
+    def test_health_check(self, client, endpoint):
         """Test health check endpoint if it exists"""
-        client = TestClient(app)
-
-        # Try common health check endpoints
-        for endpoint in ["/health", "/status", "/ping"]:
-            response = client.get(endpoint)
-            # Don't assert status code since endpoint might not exist
-            # Just ensure no server error
-            assert response.status_code != 500
+        response = client.get(endpoint)
+        # Don't assert status code since endpoint might not exist
+        # Just ensure no server error
+        assert response.status_code != 500
 
 
 class TestStationsAPI:
     """Test stations API endpoints"""
 
-    @patch("api.media_player")
-    def test_get_stations(self, mock_media_player):
+    def test_get_stations(self, api_media_player, client):
         """Test getting all stations"""
-        # Mock media player response
-        mock_media_objects = {
-            "test_radio": MediaObject(
-                id="test_radio",
-                name="Test Radio",
-                media_type=MediaType.RADIO,
-                path="http://example.com/stream.mp3",
-                description="Test station",
-            )
-        }
-        mock_media_player.get_media_objects.return_value = mock_media_objects
+        api_media_player.get_media_objects.return_value = CANNED_STATIONS
 
-        client = TestClient(app)
         response = client.get("/stations")
 
         assert response.status_code == 200
@@ -64,13 +102,11 @@ class TestStationsAPI:
         assert "test_radio" in data
         assert data["test_radio"]["name"] == "Test Radio"
 
-    @patch("api.media_player")
-    def test_add_station(self, mock_media_player):
+    def test_add_station(self, api_media_player, client):
         """Test adding a new station"""
-        mock_media_player.config_manager.add_station.return_value = True
-        mock_media_player.config_manager.save_config.return_value = True
+        api_media_player.config_manager.add_station.return_value = True
+        api_media_player.config_manager.save_config.return_value = True
 
-        client = TestClient(app)
         station_data = {
             "name": "New Test Station",
             "url": "http://example.com/new_stream.mp3",
@@ -82,13 +118,11 @@ class TestStationsAPI:
         # Should succeed or fail gracefully
         assert response.status_code in [200, 400, 422]
 
-    @patch("api.media_player")
-    def test_remove_station(self, mock_media_player):
+    def test_remove_station(self, api_media_player, client):
         """Test removing a station"""
-        mock_media_player.config_manager.remove_station.return_value = True
-        mock_media_player.config_manager.save_config.return_value = True
+        api_media_player.config_manager.remove_station.return_value = True
+        api_media_player.config_manager.save_config.return_value = True
 
-        client = TestClient(app)
         response = client.delete("/stations/test_station")
 
         # Should succeed or fail gracefully
@@ -98,17 +132,10 @@ class TestStationsAPI:
 class TestPlaybackAPI:
     """Test playback control API endpoints"""
 
-    @patch("api.media_player")
-    def test_get_status(self, mock_media_player):
+    def test_get_status(self, api_media_player, client):
         """Test getting player status"""
-        # Mock player status
-        mock_status = PlayerStatus(
-            state=PlayerState.STOPPED,
-            volume=0.5,
-        )
-        mock_media_player.get_status.return_value = mock_status
-
-        client = TestClient(app)
+        api_media_player.get_status.return_value = STOPPED_STATUS
+
         response = client.get("/status")
 
         assert response.status_code == 200
@@ -117,47 +144,39 @@ class TestPlaybackAPI:
         assert "volume" in data
         assert data["state"] == "stopped"
 
-    @patch("api.media_player")
-    def test_play_media(self, mock_media_player):
+    def test_play_media(self, api_media_player, client):
         """Test playing media"""
-        mock_media_player.play_media.return_value = True
+        api_media_player.play_media.return_value = True
 
-        client = TestClient(app)
         response = client.post("/play/test_station")
 
         # Should succeed or fail gracefully
         assert response.status_code in [200, 400, 404]
 
-    @patch("api.media_player")
-    def test_stop_playback(self, mock_media_player):
+    def test_stop_playback(self, api_media_player, client):
         """Test stopping playback"""
-        mock_media_player.stop.return_value = True
+        api_media_player.stop.return_value = True
 
-        client = TestClient(app)
         response = client.post("/stop")
 
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
 
-    @patch("api.media_player")
-    def test_pause_playback(self, mock_media_player):
+    def test_pause_playback(self, api_media_player, client):
         """Test pausing playback"""
-        mock_media_player.pause.return_value = True
+        api_media_player.pause.return_value = True
 
-        client = TestClient(app)
         response = client.post("/pause")
 
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
 
-    @patch("api.media_player")
-    def test_resume_playback(self, mock_media_player):
+    def test_resume_playback(self, api_media_player, client):
         """Test resuming playback"""
-        mock_media_player.resume.return_value = True
+        api_media_player.resume.return_value = True
 
-        client = TestClient(app)
         response = client.post("/resume")
 
         assert response.status_code == 200
@@ -168,12 +187,10 @@ class TestPlaybackAPI:
 class TestVolumeAPI:
     """Test volume control API endpoints"""
 
-    @patch("api.media_player")
-    def test_set_volume(self, mock_media_player):
+    def test_set_volume(self, api_media_player, client):
         """Test setting volume"""
-        mock_media_player.set_volume.return_value = True
+        api_media_player.set_volume.return_value = True
 
-        client = TestClient(app)
         response = client.post("/volume/0.5")
 
         assert response.status_code == 200
@@ -181,98 +198,67 @@ class TestVolumeAPI:
         assert "message" in data
         assert "volume" in data
 
-    @patch("api.media_player")
-    def test_set_volume_invalid(self, mock_media_player):
+    # Negative, > 1 and non-numeric volumes
+    @pytest.mark.parametrize("volume", ["-0.1", "1.5", "invalid"])
+    def test_set_volume_invalid(self, client, volume):
         """Test setting invalid volume"""
-        client = TestClient(app)
-
-        # Test negative volume
-        response = client.post("/volume/-0.1")
-        assert response.status_code in [400, 422]
-
-        # Test volume > 1
-        response = client.post("/volume/1.5")
-        assert response.status_code in [400, 422]
-
-        # Test non-numeric volume
-        response = client.post("/volume/invalid")
+        response = client.post(f"/volume/{volume}")
         assert response.status_code in [400, 422]
 
 
 class TestAlbumsAPI:
     """Test albums API endpoints"""
 
-    @patch("api.media_player")
-    def test_get_albums(self, mock_media_player):
+    def test_get_albums(self, api_media_player, client):
         """Test getting all albums"""
-        # Mock media player response with albums
-        mock_media_objects = {
-            "test_album": Mock(
-                id="test_album",
-                name="Test Album",
-                media_type="album",
-                album=Mock(
-                    name="Test Album",
-                    tracks=[Mock(title="Track 1"), Mock(title="Track 2")],
-                    track_count=2,
-                ),
-            )
-        }
-        mock_media_player.get_media_objects.return_value = mock_media_objects
+        api_media_player.get_media_objects.return_value = CANNED_ALBUMS
 
-        client = TestClient(app)
         response = client.get("/albums")
 
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, dict)
-
-    @patch("api.media_player")
-    def test_album_track_controls(self, mock_media_player):
+        assert data["test_album"]["name"] == "Test Album"
+        assert data["test_album"]["album"]["track_count"] == 2
+
+    @pytest.mark.parametrize(
+        "endpoint, player_method",
+        [("/next", "next_track"), ("/previous", "previous_track")],
+    )
+    def test_album_track_controls(
+        self, api_media_player, client, endpoint, player_method
+    ):
         """Test album track control endpoints"""
-        mock_media_player.next_track.return_value = True
-        mock_media_player.previous_track.return_value = True
-
-        client = TestClient(app)
+        getattr(api_media_player, player_method).return_value = True
 
-        # Test next track
-        response = client.post("/next")
-        assert response.status_code == 200
-
-        # Test previous track
-        response = client.post("/previous")
+        response = client.post(endpoint)
         assert response.status_code == 200
+        getattr(api_media_player, player_method).assert_called_once()
 
 
 class TestErrorHandling:
     """Test API error handling"""
 
-    @patch("api.media_player")
-    def test_play_nonexistent_media(self, mock_media_player):
+    def test_play_nonexistent_media(self, api_media_player, client):
         """Test playing non-existent media"""
-        mock_media_player.play_media.return_value = False
+        api_media_player.play_media.return_value = False
 
-        client = TestClient(app)
         response = client.post("/play/nonexistent")
 
         # Should return appropriate error
         assert response.status_code in [400, 404]
 
-    @patch("api.media_player")
-    def test_media_player_exception(self, mock_media_player):
+    def test_media_player_exception(self, api_media_player, client):
         """Test handling media player exceptions"""
-        mock_media_player.get_status.side_effect = Exception("Test error")
+        api_media_player.get_status.side_effect = Exception("Test error")
 
-        client = TestClient(app)
         response = client.get("/status")
 
         # Should handle exception gracefully
         assert response.status_code in [500, 503]
 
-    def test_invalid_endpoints(self):
+    def test_invalid_endpoints(self, client):
         """Test invalid endpoints return 404"""
-        client = TestClient(app)
-
         response = client.get("/invalid/endpoint")
         assert response.status_code == 404
 
@@ -283,10 +269,9 @@ class TestErrorHandling:
 class TestCORS:
     """Test CORS configuration"""
 
-    def test_cors_headers(self):
+    async def test_cors_headers(self, async_client):
         """Test that CORS headers are present"""
-        client = TestClient(app)
-        response = client.options("/")
+        response = await async_client.options("/")
 
         # Should have CORS headers or handle OPTIONS request
         assert response.status_code in [
@@ -294,15 +279,14 @@ class TestCORS:
             405,
         ]  # 405 if OPTIONS not explicitly handled
 
-    def test_cors_preflight(self):
+    async def test_cors_preflight(self, async_client):
         """Test CORS preflight request"""
-        client = TestClient(app)
         headers = {
             "Origin": "http://localhost:3000",
             "Access-Control-Request-Method": "GET",
             "Access-Control-Request-Headers": "Content-Type",
         }
 
-        response = client.options("/stations", headers=headers)
+        response = await async_client.options("/stations", headers=headers)
         # Should handle preflight or return method not allowed
         assert response.status_code in [200, 405]
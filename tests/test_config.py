@@ -3,14 +3,36 @@ Tests for configuration management
 """
 
 import pytest
-import json
-import tempfile
-import os
 from unittest.mock import Mock, patch
 
 from media_config_manager import MediaConfigManager
 
 
+CONFIG_SECTIONS = ("stations", "ui", "streamdeck", "colors")
+COLOR_STATES = ("playing", "loading", "available", "inactive", "error")
+FONT_SETTINGS_KEYS = ("font_size_range", "max_text_length", "truncate_suffix")
+
+
+def assert_rgb_colors(colors):
+    """Assert every color is a 3-component RGB value in 0..255"""
+    for color_name, color_value in colors.items():
+        assert isinstance(color_value, (list, tuple))
+        assert len(color_value) == 3
+        for component in color_value:
+            assert isinstance(component, int)
+            assert 0 <= component <= 255
+
+
+def assert_ui_config_shape(ui_config):
+    """Assert the UI config carries the expected font settings"""
+    assert isinstance(ui_config, dict)
+    assert "font_settings" in ui_config
+
+    font_settings = ui_config["font_settings"]
+    for key in FONT_SETTINGS_KEYS:
+        assert key in font_settings
+
+
 class TestMediaConfigManager:
     """Test MediaConfigManager functionality"""
 
@@ -20,30 +42,45 @@ class TestMediaConfigManager:
         assert config_manager is not None
         assert str(config_manager.config_file) == temp_config_file
 
-    def test_load_config(self, temp_config_file):
-        """Test loading configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        config = config_manager.load_config()
+    @pytest.mark.parametrize(
+        "getter,required_keys",
+        [
+            ("load_config", set(CONFIG_SECTIONS)),
+            ("get_stations", {"test_station"}),
+            ("get_colors", set(COLOR_STATES)),
+            ("get_streamdeck_config", {"brightness", "update_interval", "carousel"}),
+            ("get_ui_config", {"font_settings"}),
+        ],
+    )
+    def test_getter(self, ro_config_manager, getter, required_keys):
+        """Test read-only getters return dicts carrying the expected keys"""
+        result = getattr(ro_config_manager, getter)()
+
+        assert isinstance(result, dict)
+        assert required_keys <= result.keys()
+
+    def test_station_details(self, ro_config_manager):
+        """Test station entries keep their configured values"""
+        stations = ro_config_manager.get_stations()
+        assert stations["test_station"]["name"] == "Test Station"
 
-        assert isinstance(config, dict)
-        assert "stations" in config
-        assert "ui" in config
-        assert "streamdeck" in config
-        assert "colors" in config
+    def test_color_values(self, ro_config_manager):
+        """Test colors are RGB triples"""
+        assert_rgb_colors(ro_config_manager.get_colors())
 
-    def test_get_stations(self, temp_config_file):
-        """Test getting stations from config"""
-        config_manager = MediaConfigManager(temp_config_file)
-        stations = config_manager.get_stations()
+    def test_carousel_config(self, ro_config_manager):
+        """Test the StreamDeck carousel section is complete"""
+        carousel_config = ro_config_manager.get_streamdeck_config()["carousel"]
+        assert "infinite_wrap" in carousel_config
+        assert "auto_reset_seconds" in carousel_config
+        assert "default_position" in carousel_config
 
-        assert isinstance(stations, dict)
-        assert "test_station" in stations
-        assert stations["test_station"]["name"] == "Test Station"
+    def test_font_settings(self, ro_config_manager):
+        """Test the UI config carries the expected font settings"""
+        assert_ui_config_shape(ro_config_manager.get_ui_config())
 
-    def test_add_station(self, temp_config_file):
+    def test_add_station(self, config_manager):
         """Test adding a new station"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         station_data = {
             "name": "New Station",
             "url": "http://example.com/new.mp3",
@@ -58,10 +95,8 @@ class TestMediaConfigManager:
         assert "new_station" in stations
         assert stations["new_station"]["name"] == "New Station"
 
-    def test_remove_station(self, temp_config_file):
+    def test_remove_station(self, config_manager):
         """Test removing a station"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         # First add a station to remove
         station_data = {"name": "Temp Station", "url": "http://example.com/temp.mp3"}
         config_manager.add_station("temp_station", station_data)
@@ -74,64 +109,13 @@ class TestMediaConfigManager:
         stations = config_manager.get_stations()
         assert "temp_station" not in stations
 
-    def test_remove_nonexistent_station(self, temp_config_file):
+    def test_remove_nonexistent_station(self, config_manager):
         """Test removing a non-existent station"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         result = config_manager.remove_station("nonexistent_station")
         assert result is False
 
-    def test_get_colors(self, temp_config_file):
-        """Test getting color configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        colors = config_manager.get_colors()
-
-        assert isinstance(colors, dict)
-        assert "playing" in colors
-        assert "loading" in colors
-        assert "available" in colors
-        assert "inactive" in colors
-        assert "error" in colors
-
-        # Check color format (should be tuples of RGB values)
-        for color_name, color_value in colors.items():
-            assert isinstance(color_value, (list, tuple))
-            assert len(color_value) == 3
-            for component in color_value:
-                assert 0 <= component <= 255
-
-    def test_get_streamdeck_config(self, temp_config_file):
-        """Test getting StreamDeck configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        streamdeck_config = config_manager.get_streamdeck_config()
-
-        assert isinstance(streamdeck_config, dict)
-        assert "brightness" in streamdeck_config
-        assert "update_interval" in streamdeck_config
-        assert "carousel" in streamdeck_config
-
-        carousel_config = streamdeck_config["carousel"]
-        assert "infinite_wrap" in carousel_config
-        assert "auto_reset_seconds" in carousel_config
-        assert "default_position" in carousel_config
-
-    def test_get_ui_config(self, temp_config_file):
-        """Test getting UI configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        ui_config = config_manager.get_ui_config()
-
-        assert isinstance(ui_config, dict)
-        assert "font_settings" in ui_config
-
-        font_settings = ui_config["font_settings"]
-        assert "font_size_range" in font_settings
-        assert "max_text_length" in font_settings
-        assert "truncate_suffix" in font_settings
-
-    def test_save_config(self, temp_config_file):
+    def test_save_config(self, config_manager):
         """Test saving configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         # Add a station
         station_data = {
             "name": "Save Test Station",
@@ -144,109 +128,68 @@ class TestMediaConfigManager:
         assert result is True
 
         # Create new config manager to verify persistence
-        new_config_manager = MediaConfigManager(temp_config_file)
+        new_config_manager = MediaConfigManager(
+            str(config_manager.config_file), str(config_manager.media_objects_file)
+        )
         stations = new_config_manager.get_stations()
         assert "save_test" in stations
 
-    def test_config_file_not_found(self):
+    def test_config_file_not_found(self, tmp_path):
         """Test handling of missing config file"""
-        with tempfile.NamedTemporaryFile(delete=True) as temp_file:
-            nonexistent_file = temp_file.name
+        nonexistent_file = tmp_path / "missing.json"
 
-        # File should not exist now
-        assert not os.path.exists(nonexistent_file)
+        # File should not exist
+        assert not nonexistent_file.exists()
 
         # Should handle gracefully
-        config_manager = MediaConfigManager(nonexistent_file)
+        config_manager = MediaConfigManager(str(nonexistent_file))
         config = config_manager.load_config()
 
         # Should return default config or empty dict
         assert isinstance(config, dict)
 
-    def test_invalid_json_config(self):
+    def test_invalid_json_config(self, invalid_json_file):
         """Test handling of invalid JSON config file"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("invalid json content {")
-            invalid_file = f.name
-
-        try:
-            config_manager = MediaConfigManager(invalid_file)
-            config = config_manager.load_config()
+        config_manager = MediaConfigManager(invalid_json_file)
+        config = config_manager.load_config()
 
-            # Should handle gracefully and return default config
-            assert isinstance(config, dict)
-        finally:
-            if os.path.exists(invalid_file):
-                os.unlink(invalid_file)
+        # Should handle gracefully and return default config
+        assert isinstance(config, dict)
 
 
 class TestConfigDefaults:
     """Test configuration defaults"""
 
-    def test_default_stations(self):
-        """Test that default stations are available"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            # Create minimal config
-            json.dump({"stations": {}}, f)
-            temp_file = f.name
-
-        try:
-            config_manager = MediaConfigManager(temp_file)
-
+    @pytest.mark.parametrize(
+        "getter, check",
+        [
             # Should have some default behavior
-            stations = config_manager.get_stations()
-            assert isinstance(stations, dict)
-
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-
-    def test_default_colors(self):
-        """Test that default colors are available"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            # Create config without colors
-            json.dump({"stations": {}}, f)
-            temp_file = f.name
-
-        try:
-            config_manager = MediaConfigManager(temp_file)
-            colors = config_manager.get_colors()
-
-            # Should have default colors
-            assert isinstance(colors, dict)
-            assert len(colors) > 0
-
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-
-    def test_default_streamdeck_config(self):
-        """Test that default StreamDeck config is available"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            # Create config without streamdeck section
-            json.dump({"stations": {}}, f)
-            temp_file = f.name
-
-        try:
-            config_manager = MediaConfigManager(temp_file)
-            streamdeck_config = config_manager.get_streamdeck_config()
-
-            # Should have default config
-            assert isinstance(streamdeck_config, dict)
-            assert "brightness" in streamdeck_config or len(streamdeck_config) == 0
-
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+            (MediaConfigManager.get_stations, lambda d: isinstance(d, dict)),
+            # Config without colors should fall back to default colors
+            (
+                MediaConfigManager.get_colors,
+                lambda d: isinstance(d, dict) and len(d) > 0,
+            ),
+            # Config without streamdeck section should fall back to defaults
+            (
+                MediaConfigManager.get_streamdeck_config,
+                lambda d: isinstance(d, dict)
+                and ("brightness" in d or len(d) == 0),
+            ),
+        ],
+        ids=["stations", "colors", "streamdeck_config"],
+    )
+    def test_defaults(self, minimal_config_file, getter, check):
+        """Test that defaults are available for a minimal config"""
+        config_manager = MediaConfigManager(minimal_config_file)
+        assert check(getter(config_manager))
 
 
 class TestConfigValidation:
     """Test configuration validation"""
 
-    def test_station_validation(self, temp_config_file):
+    def test_station_validation(self, config_manager):
         """Test station data validation"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         # Test valid station
         valid_station = {
             "name": "Valid Station",
@@ -270,16 +213,9 @@ class TestConfigValidation:
             # This is also acceptable behavior
             pass
 
-    def test_color_validation(self, temp_config_file):
+    def test_color_validation(self, ro_config_manager):
         """Test color configuration validation"""
-        config_manager = MediaConfigManager(temp_config_file)
-        colors = config_manager.get_colors()
+        colors = ro_config_manager.get_colors()
 
         # All colors should be valid RGB tuples/lists
-        for color_name, color_value in colors.items():
-            assert isinstance(color_value, (list, tuple))
-            assert len(color_value) == 3
-
-            for component in color_value:
-                assert isinstance(component, int)
-                assert 0 <= component <= 255
+        assert_rgb_colors(colors)
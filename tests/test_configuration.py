@@ -1,5 +1,7 @@
 """
-Tests for configuration management
+Tests for configuration management via the media objects API
+
+Config loading, colors and UI config are covered in test_config.py.
 """
 
 import pytest
@@ -14,36 +16,16 @@ from media_config_manager import MediaConfigManager
 class TestMediaConfigManager:
     """Test MediaConfigManager functionality"""
 
-    def test_config_manager_init(self, temp_config_file):
-        """Test config manager initialization"""
-        config_manager = MediaConfigManager(temp_config_file)
-        assert config_manager is not None
-        assert str(config_manager.config_file) == temp_config_file
-
-    def test_load_config(self, temp_config_file):
-        """Test loading configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        config = config_manager.load_config()
-
-        assert isinstance(config, dict)  # load_config returns dict now
-        assert "stations" in config
-        assert "ui" in config
-        assert "streamdeck" in config
-        assert "colors" in config
-
-    def test_get_stations(self, temp_config_file):
+    def test_get_stations(self, ro_config_manager):
         """Test getting stations from config"""
-        config_manager = MediaConfigManager(temp_config_file)
-        stations = config_manager.get_radio_stations()  # Correct method name
+        stations = ro_config_manager.get_radio_stations()  # Correct method name
 
         assert isinstance(stations, dict)
         # Note: get_radio_stations() gets from media_objects, not config stations
         # So we might not find test_station unless it's in media_objects
 
-    def test_add_station(self, temp_config_file):
+    def test_add_station(self, config_manager):
         """Test adding a new station"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         result = config_manager.add_radio_station(  # Correct method name
             "new_station",
             "New Station",
@@ -58,10 +40,8 @@ class TestMediaConfigManager:
         assert "new_station" in stations
         assert stations["new_station"]["name"] == "New Station"
 
-    def test_remove_station(self, temp_config_file):
+    def test_remove_station(self, config_manager):
         """Test removing a station"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         # First add a station to remove
         config_manager.add_radio_station(  # Correct method name
             "temp_station", "Temp Station", "http://example.com/temp.mp3"
@@ -77,36 +57,16 @@ class TestMediaConfigManager:
         stations = config_manager.get_radio_stations()
         assert "temp_station" not in stations
 
-    def test_remove_nonexistent_station(self, temp_config_file):
+    def test_remove_nonexistent_station(self, config_manager):
         """Test removing a station that doesn't exist"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         result = config_manager.remove_media_object(
             "nonexistent"
         )  # Correct method name
         assert result is False
 
-    def test_get_colors(self, temp_config_file):
-        """Test getting color configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        colors = config_manager.get_colors()
-
-        assert isinstance(colors, dict)
-        assert "playing" in colors
-        assert "loading" in colors
-        assert "available" in colors
-        assert "inactive" in colors
-        assert "error" in colors
-
-        # Check color format (should be tuples)
-        for color_name, color_value in colors.items():
-            assert isinstance(color_value, (list, tuple))
-            assert len(color_value) == 3  # RGB
-
-    def test_get_streamdeck_config(self, temp_config_file):
+    def test_get_streamdeck_config(self, ro_config_manager):
         """Test getting StreamDeck configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        streamdeck_config = config_manager.get_streamdeck_config()
+        streamdeck_config = ro_config_manager.get_streamdeck_config()
 
         assert isinstance(streamdeck_config, dict)
         assert "brightness" in streamdeck_config
@@ -115,23 +75,8 @@ class TestMediaConfigManager:
         # So it will return the default config which has "button_layout" instead of "carousel"
         assert "button_layout" in streamdeck_config
 
-    def test_get_ui_config(self, temp_config_file):
-        """Test getting UI configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-        ui_config = config_manager.get_ui_config()
-
-        assert isinstance(ui_config, dict)
-        assert "font_settings" in ui_config
-
-        font_settings = ui_config["font_settings"]
-        assert "font_size_range" in font_settings
-        assert "max_text_length" in font_settings
-        assert "truncate_suffix" in font_settings
-
-    def test_save_config(self, temp_config_file):
+    def test_save_config(self, config_manager):
         """Test saving configuration"""
-        config_manager = MediaConfigManager(temp_config_file)
-
         # Add a station
         config_manager.add_radio_station(  # Correct method name
             "save_test", "Save Test Station", "http://example.com/save.mp3"
@@ -142,6 +87,8 @@ class TestMediaConfigManager:
         assert result is True
 
         # Create new config manager and verify station persisted
-        new_config_manager = MediaConfigManager(temp_config_file)
+        new_config_manager = MediaConfigManager(
+            str(config_manager.config_file), str(config_manager.media_objects_file)
+        )
         stations = new_config_manager.get_radio_stations()
         assert "save_test" in stations
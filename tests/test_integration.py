@@ -3,49 +3,28 @@ Integration tests for the radio streamer system
 """
 
 import pytest
-import time
-import tempfile
-import os
-from unittest.mock import Mock, patch, MagicMock
-from fastapi.testclient import TestClient
 
-from api import app
 from media_player import MediaPlayer
 from media.types import PlayerState, MediaType
+from tests.conftest import first
+from tests.fakes import STOPPED_STATUS
 
 
 class TestAPIMediaPlayerIntegration:
     """Test integration between API and MediaPlayer"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    @patch("api.media_player")
     def test_api_media_player_flow(
-        self, mock_api_player, mock_vlc, temp_config_file, temp_music_folder
+        self, api_media_player, stub_player_snapshots, client
     ):
         """Test complete flow from API to MediaPlayer"""
-        # Setup VLC mock
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_instance.media_player_new.return_value = mock_player
-        mock_player.play.return_value = 0
-        mock_player.get_state.return_value = 3  # Playing
-        mock_player.audio_get_volume.return_value = 50
-        mock_vlc.Instance.return_value = mock_instance
-
-        # Create real MediaPlayer for testing
-        real_player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
-
-        # Mock the API's media player
-        mock_api_player.get_media_objects.return_value = real_player.get_media_objects()
-        mock_api_player.get_status.return_value = real_player.get_status()
-        mock_api_player.play_media.return_value = True
-        mock_api_player.stop.return_value = True
-        mock_api_player.set_volume.return_value = True
-
-        client = TestClient(app)
+        # Feed the API's media player snapshots taken from a real MediaPlayer
+        api_media_player.get_media_objects.return_value = stub_player_snapshots[
+            "media_objects"
+        ]
+        api_media_player.get_status.return_value = stub_player_snapshots["status"]
+        api_media_player.play_media.return_value = True
+        api_media_player.stop.return_value = True
+        api_media_player.set_volume.return_value = True
 
         # Test getting stations
         response = client.get("/stations")
@@ -61,7 +40,7 @@ class TestAPIMediaPlayerIntegration:
 
         # Test playing media (if stations available)
         if stations:
-            station_id = list(stations.keys())[0]
+            station_id = first(stations)
             response = client.post(f"/play/{station_id}")
             assert response.status_code in [200, 400]  # Might fail without audio
 
@@ -77,16 +56,10 @@ class TestAPIMediaPlayerIntegration:
 class TestMediaPlayerConfigIntegration:
     """Test integration between MediaPlayer and configuration"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
     def test_media_player_config_loading(
-        self, mock_vlc, temp_config_file, temp_music_folder
+        self, vlc_mock, temp_config_file, temp_music_folder
     ):
         """Test MediaPlayer loads configuration correctly"""
-        # Setup VLC mock
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
         )
@@ -105,16 +78,10 @@ class TestMediaPlayerConfigIntegration:
 
         assert station_found, "Test station from config not found"
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
     def test_media_player_album_loading(
-        self, mock_vlc, temp_config_file, temp_music_folder
+        self, vlc_mock, temp_config_file, temp_music_folder
     ):
         """Test MediaPlayer loads albums correctly"""
-        # Setup VLC mock
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
         )
@@ -137,20 +104,14 @@ class TestMediaPlayerConfigIntegration:
         assert album_found, "Test album not found"
 
 
-@pytest.mark.skipif(True, reason="Requires StreamDeck hardware")
+@pytest.mark.skip(reason="Requires StreamDeck hardware")
 class TestStreamDeckIntegration:
     """Test StreamDeck integration (requires hardware)"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
     def test_streamdeck_media_player_integration(
-        self, mock_vlc, temp_config_file, temp_music_folder
+        self, vlc_mock, temp_config_file, temp_music_folder
     ):
         """Test StreamDeck integration with MediaPlayer"""
-        # Setup VLC mock
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
         )
@@ -176,27 +137,10 @@ class TestStreamDeckIntegration:
 class TestEndToEndFlow:
     """Test complete end-to-end workflows"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
     def test_complete_radio_workflow(
-        self, mock_vlc, temp_config_file, temp_music_folder
+        self, vlc_mock, temp_config_file, temp_music_folder
     ):
         """Test complete radio station workflow"""
-        # Setup VLC mock
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_media = Mock()
-
-        mock_instance.media_player_new.return_value = mock_player
-        mock_instance.media_new.return_value = mock_media
-        mock_player.play.return_value = 0
-        mock_player.stop.return_value = None
-        mock_player.pause.return_value = None
-        mock_player.get_state.return_value = 1  # Stopped initially
-        mock_player.audio_get_volume.return_value = 50
-        mock_player.audio_set_volume.return_value = 0
-        mock_vlc.Instance.return_value = mock_instance
-
         # Create MediaPlayer
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
@@ -243,25 +187,10 @@ class TestEndToEndFlow:
         # 9. Clean up
         player.cleanup()
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
     def test_complete_album_workflow(
-        self, mock_vlc, temp_config_file, temp_music_folder
+        self, vlc_mock, temp_config_file, temp_music_folder
     ):
         """Test complete album workflow"""
-        # Setup VLC mock
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_media = Mock()
-
-        mock_instance.media_player_new.return_value = mock_player
-        mock_instance.media_new.return_value = mock_media
-        mock_player.play.return_value = 0
-        mock_player.stop.return_value = None
-        mock_player.get_state.return_value = 1
-        mock_player.audio_get_volume.return_value = 50
-        mock_vlc.Instance.return_value = mock_instance
-
         # Create MediaPlayer
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
@@ -303,18 +232,11 @@ class TestEndToEndFlow:
 class TestErrorHandlingIntegration:
     """Test error handling across components"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_vlc_error_handling(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_vlc_error_handling(self, vlc_mock, temp_config_file, temp_music_folder):
         """Test handling of VLC errors"""
-        # Setup VLC mock to simulate errors
-        mock_instance = Mock()
-        mock_player = Mock()
-
-        mock_instance.media_player_new.return_value = mock_player
-        mock_player.play.return_value = -1  # Error
-        mock_player.get_state.side_effect = Exception("VLC error")
-        mock_vlc.Instance.return_value = mock_instance
+        # Simulate VLC errors
+        vlc_mock.play.return_value = -1
+        vlc_mock.get_state.side_effect = Exception("VLC error")
 
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
@@ -323,7 +245,7 @@ class TestErrorHandlingIntegration:
         # Should handle VLC errors gracefully
         media_objects = player.get_media_objects()
         if media_objects:
-            first_media = list(media_objects.keys())[0]
+            first_media = first(media_objects)
             result = player.play_media(first_media)
             # Should not crash, might return False
             assert isinstance(result, bool)
@@ -334,17 +256,14 @@ class TestErrorHandlingIntegration:
         # Might be in error state
         assert hasattr(status, "state")
 
-    @patch("api.media_player")
-    def test_api_error_handling(self, mock_media_player):
+    def test_api_error_handling(self, api_media_player, client):
         """Test API error handling"""
         # Mock media player to raise exceptions
-        mock_media_player.get_status.side_effect = Exception("Media player error")
-        mock_media_player.get_media_objects.side_effect = Exception(
+        api_media_player.get_status.side_effect = Exception("Media player error")
+        api_media_player.get_media_objects.side_effect = Exception(
             "Media objects error"
         )
-        mock_media_player.play_media.side_effect = Exception("Playback error")
-
-        client = TestClient(app)
+        api_media_player.play_media.side_effect = Exception("Playback error")
 
         # API should handle exceptions gracefully
         response = client.get("/status")
@@ -353,88 +272,51 @@ class TestErrorHandlingIntegration:
         response = client.post("/play/test")
         assert response.status_code in [400, 500]  # Error response
 
-    def test_config_error_handling(self):
+    def test_config_error_handling(self, invalid_json_file):
         """Test configuration error handling"""
-        # Test with invalid config file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("invalid json {")
-            invalid_config = f.name
-
-        try:
-            from media_config_manager import MediaConfigManager
+        from media_config_manager import MediaConfigManager
 
-            config_manager = MediaConfigManager(invalid_config)
+        config_manager = MediaConfigManager(invalid_json_file)
 
-            # Should handle invalid JSON gracefully
-            config = config_manager.load_config()
-            assert isinstance(config, dict)
+        # Should handle invalid JSON gracefully
+        config = config_manager.load_config()
+        assert isinstance(config, dict)
 
-            stations = config_manager.get_stations()
-            assert isinstance(stations, dict)
-
-        finally:
-            os.unlink(invalid_config)
+        stations = config_manager.get_stations()
+        assert isinstance(stations, dict)
 
 
 class TestPerformanceIntegration:
     """Test performance aspects of integration"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_startup_performance(self, mock_vlc, temp_config_file, temp_music_folder):
-        """Test that startup is reasonably fast"""
-        # Setup VLC mock
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        start_time = time.time()
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
-
-        # Get media objects (triggers loading)
-        media_objects = player.get_media_objects()
-
-        end_time = time.time()
-        startup_time = end_time - start_time
-
-        # Should start up in reasonable time (adjust threshold as needed)
-        assert startup_time < 5.0, f"Startup took {startup_time:.2f} seconds"
-
-        player.cleanup()
-
-    @patch("api.media_player")
-    def test_api_response_time(self, mock_media_player):
-        """Test API response times"""
-        from media.types import PlayerStatus, PlayerState
-
+    @pytest.mark.benchmark
+    def test_startup_performance(
+        self, vlc_mock, temp_config_file, temp_music_folder, benchmark
+    ):
+        """Benchmark player startup including media object loading"""
+
+        def start_player():
+            player = MediaPlayer(
+                music_folder=temp_music_folder, config_file=temp_config_file
+            )
+            # Get media objects (triggers loading)
+            media_objects = player.get_media_objects()
+            player.cleanup()
+            return media_objects
+
+        media_objects = benchmark(start_player)
+        assert isinstance(media_objects, dict)
+
+    @pytest.mark.benchmark
+    def test_api_response_time(self, api_media_player, client, benchmark):
+        """Benchmark a status + stations API round trip"""
         # Mock fast responses
-        mock_status = PlayerStatus(
-            state=PlayerState.STOPPED,
-            volume=0.5,
-            current_media=None,
-            current_track=None,
-            track_position=0,
-            error_message=None,
-        )
-        mock_media_player.get_status.return_value = mock_status
-        mock_media_player.get_media_objects.return_value = {}
-
-        client = TestClient(app)
-
-        start_time = time.time()
-
-        # Test multiple API calls
-        for _ in range(10):
-            response = client.get("/status")
-            assert response.status_code == 200
-
-            response = client.get("/stations")
-            assert response.status_code == 200
+        api_media_player.get_status.return_value = STOPPED_STATUS
+        api_media_player.get_media_objects.return_value = {}
 
-        end_time = time.time()
-        total_time = end_time - start_time
+        def status_and_stations():
+            for endpoint in ("/status", "/stations"):
+                response = client.get(endpoint)
+                assert response.status_code == 200
 
-        # Should handle 20 requests quickly
-        assert total_time < 2.0, f"20 API calls took {total_time:.2f} seconds"
+        benchmark.pedantic(status_and_stations, rounds=10, iterations=1)
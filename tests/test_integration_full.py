@@ -3,37 +3,21 @@ Integration tests for the radio streamer system
 """
 
 import pytest
-import time
 import tempfile
 import os
-from unittest.mock import Mock, patch, MagicMock
-from fastapi.testclient import TestClient
 
-from api import app
 from media_player import MediaPlayer
-from media.types import PlayerState, PlayerStatus, MediaType
+from media.types import MediaType
+from tests.fakes import STOPPED_STATUS
 
 
 class TestFullSystemIntegration:
     """Test full system integration"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
     def test_api_media_player_integration(
-        self, mock_vlc, temp_config_file, temp_music_folder
+        self, vlc_mock, temp_config_file, temp_music_folder, client
     ):
         """Test API and MediaPlayer integration"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_instance.media_player_new.return_value = mock_player
-        mock_player.get_state.return_value = 1  # Stopped
-        mock_player.audio_get_volume.return_value = 50
-        mock_vlc.Instance.return_value = mock_instance
-
-        # Create test client
-        client = TestClient(app)
-
         # Test getting stations
         response = client.get("/stations")
         assert response.status_code == 200
@@ -47,16 +31,10 @@ class TestFullSystemIntegration:
         assert "state" in status
         assert "volume" in status
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
     def test_config_media_player_integration(
-        self, mock_vlc, temp_config_file, temp_music_folder
+        self, vlc_mock, temp_config_file, temp_music_folder
     ):
         """Test configuration and MediaPlayer integration"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
         # Create media player
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
@@ -78,10 +56,8 @@ class TestFullSystemIntegration:
 class TestAPIWorkflow:
     """Test complete API workflows"""
 
-    def test_station_management_workflow(self):
+    def test_station_management_workflow(self, client):
         """Test complete station management workflow"""
-        client = TestClient(app)
-
         # 1. Get initial stations
         response = client.get("/stations")
         assert response.status_code == 200
@@ -133,29 +109,18 @@ class TestAPIWorkflow:
 class TestErrorRecovery:
     """Test system error recovery"""
 
-    @patch("api.media_player")
-    def test_api_error_recovery(self, mock_media_player):
+    def test_api_error_recovery(self, api_media_player, client):
         """Test API error recovery"""
-        client = TestClient(app)
-
         # Test with media player throwing exceptions
-        mock_media_player.get_status.side_effect = Exception("Test error")
+        api_media_player.get_status.side_effect = Exception("Test error")
 
         response = client.get("/status")
         # Should handle gracefully
         assert response.status_code in [500, 503]
 
         # Reset mock and test recovery
-        mock_media_player.get_status.side_effect = None
-        mock_status = PlayerStatus(
-            state=PlayerState.STOPPED,
-            volume=0.5,
-            current_media=None,
-            current_track=None,
-            track_position=0,
-            error_message=None,
-        )
-        mock_media_player.get_status.return_value = mock_status
+        api_media_player.get_status.side_effect = None
+        api_media_player.get_status.return_value = STOPPED_STATUS
 
         response = client.get("/status")
         assert response.status_code == 200
@@ -164,41 +129,26 @@ class TestErrorRecovery:
 class TestPerformance:
     """Test system performance"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_startup_performance(self, mock_vlc, temp_config_file, temp_music_folder):
-        """Test system startup performance"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        start_time = time.time()
-
-        # Create media player
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
-
-        # Load media objects
-        media_objects = player.get_media_objects()
+    @pytest.mark.benchmark
+    def test_startup_performance(
+        self, vlc_mock, temp_config_file, temp_music_folder, benchmark
+    ):
+        """Benchmark system startup"""
 
-        end_time = time.time()
-        startup_time = end_time - start_time
+        def start_player():
+            # Create media player and load media objects
+            player = MediaPlayer(
+                music_folder=temp_music_folder, config_file=temp_config_file
+            )
+            return player.get_media_objects()
 
-        # Should start up reasonably quickly (adjust threshold as needed)
-        assert startup_time < 5.0, f"Startup took {startup_time:.2f} seconds"
+        media_objects = benchmark(start_player)
         assert len(media_objects) >= 0  # Should have loaded something
 
-    def test_api_response_time(self):
-        """Test API response times"""
-        client = TestClient(app)
-
-        start_time = time.time()
-        response = client.get("/status")
-        end_time = time.time()
-
-        response_time = end_time - start_time
+    @pytest.mark.benchmark
+    def test_api_response_time(self, api_media_player, client, benchmark):
+        """Benchmark the status endpoint"""
+        api_media_player.get_status.return_value = STOPPED_STATUS
 
-        # Should respond quickly
-        assert response_time < 1.0, f"API response took {response_time:.2f} seconds"
+        response = benchmark(client.get, "/status")
         assert response.status_code == 200
@@ -5,192 +5,150 @@ Tests for the modular media components
 import pytest
 import tempfile
 import os
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
 
-from media.types import (
-    PlayerState,
-    MediaType,
-    RadioStation,
-    Track,
-    Album,
-    MediaObject,
-    PlayerStatus,
-)
+from media.album_manager import AlbumManager
+from media.media_player import MediaPlayer as ModularMediaPlayer
+from media.player_core import VLCPlayerCore
+from media.radio_manager import RadioManager
+from media.sonos_manager import SonosManager
+from media.types import MediaType
+from tests.conftest import first
 
 
-class TestRadioManager:
-    """Test RadioManager functionality"""
-
-    @pytest.mark.skip(reason="RadioManager tests depend on VLC implementation details")
-    @patch("media.radio_manager.vlc")
-    def test_radio_manager_init(self, mock_vlc, temp_config_file):
-        """Test RadioManager initialization"""
-        try:
-            from media.radio_manager import RadioManager
-            from media_config_manager import MediaConfigManager
-
-            config_manager = MediaConfigManager(temp_config_file)
+@pytest.fixture(scope="module")
+def player_core(fake_vlc):
+    """VLCPlayerCore on the fake VLC backend, shared across the module"""
+    return VLCPlayerCore()
 
-            # Mock VLC player core
-            mock_player_core = Mock()
 
-            radio_manager = RadioManager(config_manager, mock_player_core)
-            assert radio_manager is not None
+@pytest.fixture(scope="module")
+def radio_manager(player_core):
+    """RadioManager on the shared player core, built once per module"""
+    return RadioManager(player_core)
 
-        except ImportError:
-            pytest.skip("RadioManager not available")
 
-    @pytest.mark.skip(reason="RadioManager tests depend on VLC implementation details")
-    @patch("media.radio_manager.vlc")
-    def test_radio_manager_get_stations(self, mock_vlc, temp_config_file):
-        """Test getting radio stations"""
-        try:
-            from media.radio_manager import RadioManager
-            from media_config_manager import MediaConfigManager
-
-            config_manager = MediaConfigManager(temp_config_file)
-            mock_player_core = Mock()
+@pytest.fixture(scope="module")
+def modular_player(fake_vlc, temp_config_file, temp_music_folder):
+    """Modular MediaPlayer built once per module; scans the music folder once"""
+    return ModularMediaPlayer(
+        music_folder=temp_music_folder, config_file=temp_config_file
+    )
 
-            radio_manager = RadioManager(config_manager, mock_player_core)
-            stations = radio_manager.get_radio_stations()
 
-            assert isinstance(stations, dict)
-            # Should have test station from config
-            assert len(stations) > 0
+class TestRadioManager:
+    """Test RadioManager functionality"""
 
-        except ImportError:
-            pytest.skip("RadioManager not available")
+    def test_radio_manager_init(self, radio_manager, player_core):
+        """Test RadioManager initialization"""
+        assert radio_manager.player_core is player_core
+        assert radio_manager.get_current_station() is None
+
+    def test_radio_manager_idle(self, radio_manager):
+        """Test a RadioManager with no station is not playing"""
+        assert radio_manager.is_playing_station() is False
+        assert radio_manager.pause() is False
+        assert radio_manager.resume() is False
+
+
+class TestSonosManager:
+    """Test SonosManager functionality"""
+
+    def test_create_media_objects_attaches_album_art(self, player_core, monkeypatch):
+        """Test album art is downloaded only where offered and attached by ID"""
+        sonos_manager = SonosManager(player_core)
+        sonos_manager.album_art_enabled = True
+        sonos_manager.device = object()
+        sonos_manager.favorites = [
+            SimpleNamespace(title="Jazz", uri="x-jazz", album_art_uri="http://art/1"),
+            SimpleNamespace(title="Rock", uri="x-rock", album_art_uri="http://art/2"),
+            SimpleNamespace(title="News", uri="x-news", album_art_uri=""),
+            SimpleNamespace(title="Talk", uri="x-talk"),
+        ]
+
+        submitted = []
+
+        def fake_download(album_art_uri, favorite_id):
+            submitted.append(favorite_id)
+            if album_art_uri == "http://art/1":
+                return "/cache/jazz.jpg"
+            return None
+
+        monkeypatch.setattr(sonos_manager, "_download_album_art", fake_download)
+
+        media_objects = sonos_manager.create_media_objects()
+
+        assert sorted(submitted) == ["sonos_0_jazz", "sonos_1_rock"]
+        assert list(media_objects) == [
+            "sonos_0_jazz",
+            "sonos_1_rock",
+            "sonos_2_news",
+            "sonos_3_talk",
+        ]
+        assert media_objects["sonos_0_jazz"].image_path == "/cache/jazz.jpg"
+        assert media_objects["sonos_1_rock"].image_path == ""
+        assert media_objects["sonos_2_news"].image_path == ""
+        assert media_objects["sonos_3_talk"].image_path == ""
+        assert all(obj.media_type == MediaType.SONOS for obj in media_objects.values())
 
 
 class TestAlbumManager:
     """Test AlbumManager functionality"""
 
     @pytest.mark.skip(reason="AlbumManager tests depend on VLC implementation details")
-    @patch("media.album_manager.vlc")
-    def test_album_manager_init(self, mock_vlc, temp_music_folder):
+    def test_album_manager_init(self, player_core, temp_music_folder):
         """Test AlbumManager initialization"""
-        try:
-            from media.album_manager import AlbumManager
-
-            # Mock VLC player core
-            mock_player_core = Mock()
-
-            album_manager = AlbumManager(temp_music_folder, mock_player_core)
-            assert album_manager is not None
-
-        except ImportError:
-            pytest.skip("AlbumManager not available")
+        album_manager = AlbumManager(temp_music_folder, player_core)
+        assert album_manager is not None
 
     @pytest.mark.skip(reason="AlbumManager tests depend on VLC implementation details")
-    @patch("media.album_manager.vlc")
-    def test_album_manager_scan_albums(self, mock_vlc, temp_music_folder):
+    def test_album_manager_scan_albums(self, player_core, temp_music_folder):
         """Test scanning for albums"""
-        try:
-            from media.album_manager import AlbumManager
-
-            mock_player_core = Mock()
-
-            album_manager = AlbumManager(temp_music_folder, mock_player_core)
-            albums = album_manager.get_albums()
+        album_manager = AlbumManager(temp_music_folder, player_core)
+        albums = album_manager.get_albums()
 
-            assert isinstance(albums, dict)
-            # Should find the test album we created
-            assert len(albums) >= 0
-
-        except ImportError:
-            pytest.skip("AlbumManager not available")
+        assert isinstance(albums, dict)
+        # Should find the test album we created
+        assert len(albums) >= 0
 
 
 class TestPlayerCore:
     """Test VLCPlayerCore functionality"""
 
-    @patch("media.player_core.vlc")
-    def test_player_core_init(self, mock_vlc):
+    def test_player_core_init(self):
         """Test VLCPlayerCore initialization"""
-        try:
-            from media.player_core import VLCPlayerCore
-
-            # Mock VLC instance and player
-            mock_instance = Mock()
-            mock_player = Mock()
-            mock_instance.media_player_new.return_value = mock_player
-            mock_vlc.Instance.return_value = mock_instance
-
-            player_core = VLCPlayerCore()
-            assert player_core is not None
-
-        except ImportError:
-            pytest.skip("VLCPlayerCore not available")
-
-    @patch("media.player_core.vlc")
-    def test_player_core_playback_controls(self, mock_vlc):
+        player_core = VLCPlayerCore()
+        assert player_core is not None
+
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("play_url", ("http://example.com/stream.mp3",)),
+            ("stop", ()),
+            ("pause", ()),
+            ("set_volume", (0.5,)),
+        ],
+    )
+    def test_player_core_playback_controls(self, player_core, method, args):
         """Test playback control methods"""
-        try:
-            from media.player_core import VLCPlayerCore
-
-            # Mock VLC
-            mock_instance = Mock()
-            mock_player = Mock()
-            mock_instance.media_player_new.return_value = mock_player
-            mock_instance.media_new.return_value = Mock()
-            mock_player.play.return_value = 0  # Success
-            mock_player.stop.return_value = None
-            mock_player.pause.return_value = None
-            mock_player.audio_set_volume.return_value = 0
-            mock_vlc.Instance.return_value = mock_instance
-
-            player_core = VLCPlayerCore()
-
-            # Test play_url
-            result = player_core.play_url("http://example.com/stream.mp3")
-            assert isinstance(result, bool)
+        result = getattr(player_core, method)(*args)
+        assert isinstance(result, bool)
 
-            # Test stop
-            result = player_core.stop()
-            assert isinstance(result, bool)
-
-            # Test pause
-            result = player_core.pause()
-            assert isinstance(result, bool)
-
-            # Test volume
-            result = player_core.set_volume(0.5)
-            assert isinstance(result, bool)
-
-        except ImportError:
-            pytest.skip("VLCPlayerCore not available")
-
-    @patch("media.player_core.vlc")
-    def test_player_core_status(self, mock_vlc):
+    def test_player_core_status(self):
         """Test getting player status"""
-        try:
-            from media.player_core import VLCPlayerCore
-
-            # Mock VLC
-            mock_instance = Mock()
-            mock_player = Mock()
-            mock_instance.media_player_new.return_value = mock_player
-            mock_player.get_state.return_value = 1  # Stopped
-            mock_player.audio_get_volume.return_value = 50
-            mock_player.is_playing.return_value = False
-            mock_vlc.Instance.return_value = mock_instance
-
-            player_core = VLCPlayerCore()
+        player_core = VLCPlayerCore()
 
-            # Test get state
-            state = player_core.get_state()
-            assert state is not None
+        # Test get state
+        state = player_core.get_state()
+        assert state is not None
 
-            # Test get volume
-            volume = player_core.get_volume()
-            assert isinstance(volume, (int, float))
+        # Test get volume
+        volume = player_core.get_volume()
+        assert isinstance(volume, (int, float))
 
-            # Test is playing
-            playing = player_core.is_playing()
-            assert isinstance(playing, bool)
-
-        except ImportError:
-            pytest.skip("VLCPlayerCore not available")
+        # Test is playing
+        playing = player_core.is_playing()
+        assert isinstance(playing, bool)
 
 
 class TestModularMediaPlayer:
@@ -199,157 +157,77 @@ class TestModularMediaPlayer:
     @pytest.mark.skip(
         reason="ModularMediaPlayer tests depend on VLC implementation details"
     )
-    @patch("media.media_player.vlc")
-    def test_modular_media_player_init(
-        self, mock_vlc, temp_config_file, temp_music_folder
-    ):
+    def test_modular_media_player_init(self, modular_player):
         """Test modular MediaPlayer initialization"""
-        try:
-            from media.media_player import MediaPlayer as ModularMediaPlayer
-
-            # Mock VLC
-            mock_instance = Mock()
-            mock_vlc.Instance.return_value = mock_instance
-
-            player = ModularMediaPlayer(
-                music_folder=temp_music_folder, config_file=temp_config_file
-            )
-
-            assert player is not None
-            assert hasattr(player, "radio_manager")
-            assert hasattr(player, "album_manager")
-            assert hasattr(player, "player_core")
-
-        except ImportError:
-            pytest.skip("Modular MediaPlayer not available")
+        assert modular_player is not None
+        assert hasattr(modular_player, "radio_manager")
+        assert hasattr(modular_player, "album_manager")
+        assert hasattr(modular_player, "player_core")
 
     @pytest.mark.skip(
         reason="ModularMediaPlayer tests depend on VLC implementation details"
     )
-    @patch("media.media_player.vlc")
-    def test_modular_media_player_get_objects(
-        self, mock_vlc, temp_config_file, temp_music_folder
-    ):
+    def test_modular_media_player_get_objects(self, modular_player):
         """Test getting media objects from modular player"""
-        try:
-            from media.media_player import MediaPlayer as ModularMediaPlayer
-
-            # Mock VLC
-            mock_instance = Mock()
-            mock_vlc.Instance.return_value = mock_instance
-
-            player = ModularMediaPlayer(
-                music_folder=temp_music_folder, config_file=temp_config_file
-            )
+        media_objects = modular_player.get_media_objects()
+        assert isinstance(media_objects, dict)
 
-            media_objects = player.get_media_objects()
-            assert isinstance(media_objects, dict)
+        # Should have at least the test station
+        assert len(media_objects) > 0
 
-            # Should have at least the test station
-            assert len(media_objects) > 0
+    def test_modular_media_player_sonos_objects(self, modular_player):
+        """Test Sonos favorites are empty when Sonos is disabled"""
+        assert modular_player.sonos_manager is None
+        assert modular_player.get_sonos_media_objects() == {}
 
-        except ImportError:
-            pytest.skip("Modular MediaPlayer not available")
+    def test_modular_media_player_sonos_objects_filters_by_prefix(
+        self, modular_player, monkeypatch
+    ):
+        """Test only sonos_-prefixed media objects are returned as favorites"""
+        sonos_fav, sonos_other, radio, album = object(), object(), object(), object()
+        monkeypatch.setattr(
+            modular_player,
+            "media_objects",
+            {
+                "sonos_fav": sonos_fav,
+                "radio_sonos": radio,
+                "sonos_other": sonos_other,
+                "album_1": album,
+            },
+        )
+
+        assert modular_player.get_sonos_media_objects() == {
+            "sonos_fav": sonos_fav,
+            "sonos_other": sonos_other,
+        }
 
     @pytest.mark.skip(
         reason="ModularMediaPlayer tests depend on VLC implementation details"
     )
-    @patch("media.media_player.vlc")
-    def test_modular_media_player_playback(
-        self, mock_vlc, temp_config_file, temp_music_folder
-    ):
+    def test_modular_media_player_playback(self, modular_player):
         """Test playback functionality"""
-        try:
-            from media.media_player import MediaPlayer as ModularMediaPlayer
-
-            # Mock VLC
-            mock_instance = Mock()
-            mock_player = Mock()
-            mock_instance.media_player_new.return_value = mock_player
-            mock_instance.media_new.return_value = Mock()
-            mock_player.play.return_value = 0
-            mock_vlc.Instance.return_value = mock_instance
-
-            player = ModularMediaPlayer(
-                music_folder=temp_music_folder, config_file=temp_config_file
-            )
-
-            # Get a media object to play
-            media_objects = player.get_media_objects()
-            if media_objects:
-                first_media_id = list(media_objects.keys())[0]
-
-                # Test play
-                result = player.play_media(first_media_id)
-                assert isinstance(result, bool)
-
-                # Test stop
-                result = player.stop()
-                assert isinstance(result, bool)
-
-                # Test pause
-                result = player.pause()
-                assert isinstance(result, bool)
+        player = modular_player
 
-                # Test resume
-                result = player.resume()
-                assert isinstance(result, bool)
+        # Get a media object to play
+        media_objects = player.get_media_objects()
+        if media_objects:
+            first_media_id = first(media_objects)
 
-        except ImportError:
-            pytest.skip("Modular MediaPlayer not available")
-
-
-class TestMediaAvailability:
-    """Test media component availability detection"""
-
-    def test_vlc_availability_detection(self):
-        """Test VLC availability detection"""
-        from media import VLC_AVAILABLE
-
-        assert isinstance(VLC_AVAILABLE, bool)
+            # Test play
+            result = player.play_media(first_media_id)
+            assert isinstance(result, bool)
 
-    def test_dotenv_availability_detection(self):
-        """Test dotenv availability detection"""
-        from media import DOTENV_AVAILABLE
+            # Test stop
+            result = player.stop()
+            assert isinstance(result, bool)
 
-        assert isinstance(DOTENV_AVAILABLE, bool)
+            # Test pause
+            result = player.pause()
+            assert isinstance(result, bool)
 
-    def test_media_imports(self):
-        """Test that media module imports work"""
-        try:
-            from media import (
-                PlayerState,
-                MediaType,
-                RadioStation,
-                Track,
-                Album,
-                MediaObject,
-                PlayerStatus,
-                VLCPlayerCore,
-                RadioManager,
-                AlbumManager,
-                MediaPlayer,
-            )
-
-            # All imports should succeed
-            assert all(
-                [
-                    PlayerState,
-                    MediaType,
-                    RadioStation,
-                    Track,
-                    Album,
-                    MediaObject,
-                    PlayerStatus,
-                    VLCPlayerCore,
-                    RadioManager,
-                    AlbumManager,
-                    MediaPlayer,
-                ]
-            )
-
-        except ImportError as e:
-            pytest.fail(f"Media module import failed: {e}")
+            # Test resume
+            result = player.resume()
+            assert isinstance(result, bool)
 
 
 class TestErrorHandling:
@@ -358,56 +236,37 @@ class TestErrorHandling:
     @pytest.mark.skip(
         reason="VLC error handling tests depend on VLC implementation details"
     )
-    @patch("media.media_player.vlc")
-    def test_vlc_error_handling(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_vlc_error_handling(self, modular_player, monkeypatch):
         """Test handling of VLC errors"""
-        try:
-            from media.media_player import MediaPlayer as ModularMediaPlayer
+        player = modular_player
 
-            # Mock VLC with errors
-            mock_instance = Mock()
-            mock_player = Mock()
-            mock_instance.media_player_new.return_value = mock_player
-            mock_player.play.side_effect = Exception("VLC error")
-            mock_vlc.Instance.return_value = mock_instance
+        # Make VLC fail to play
+        def failing_play():
+            raise Exception("VLC error")
 
-            player = ModularMediaPlayer(
-                music_folder=temp_music_folder, config_file=temp_config_file
-            )
+        monkeypatch.setattr(player.player_core._player, "play", failing_play)
 
-            # Should handle VLC errors gracefully
-            media_objects = player.get_media_objects()
-            if media_objects:
-                first_media_id = list(media_objects.keys())[0]
-                result = player.play_media(first_media_id)
-                # Should return False but not crash
-                assert isinstance(result, bool)
-
-        except ImportError:
-            pytest.skip("Modular MediaPlayer not available")
+        # Should handle VLC errors gracefully
+        media_objects = player.get_media_objects()
+        if media_objects:
+            first_media_id = first(media_objects)
+            result = player.play_media(first_media_id)
+            # Should return False but not crash
+            assert isinstance(result, bool)
 
     def test_missing_config_handling(self):
         """Test handling of missing configuration"""
         try:
-            from media.media_player import MediaPlayer as ModularMediaPlayer
-
             # Use non-existent config file
             with tempfile.NamedTemporaryFile(delete=True) as temp_file:
                 nonexistent_file = temp_file.name
 
             # Should handle missing config gracefully
-            with patch("media.media_player.vlc"):
-                mock_vlc = Mock()
-                mock_vlc.Instance.return_value = Mock()
-
-                player = ModularMediaPlayer(config_file=nonexistent_file)
-
-                # Should still be able to get media objects (might be empty)
-                media_objects = player.get_media_objects()
-                assert isinstance(media_objects, dict)
+            player = ModularMediaPlayer(config_file=nonexistent_file)
 
-        except ImportError:
-            pytest.skip("Modular MediaPlayer not available")
+            # Should still be able to get media objects (might be empty)
+            media_objects = player.get_media_objects()
+            assert isinstance(media_objects, dict)
         except Exception as e:
             # Should handle gracefully
             assert True  # Test passes if we get here without crashing
@@ -2,39 +2,61 @@
 Tests for the MediaPlayer class
 """
 
+import gc
 import pytest
-import os
-import tempfile
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 
+import media_player
 from media.types import PlayerState, MediaType
 from media_player import MediaPlayer
+from tests.conftest import first
+
+
+@pytest.fixture
+def mocked_media_player(vlc_mock, temp_config_file, temp_music_folder):
+    """MediaPlayer built on the mocked VLC from ``vlc_mock``
+
+    Tests that need to configure or inspect the VLC player also request
+    ``vlc_mock``, which is the same mock this player was built with.
+    """
+    return MediaPlayer(music_folder=temp_music_folder, config_file=temp_config_file)
+
+
+@pytest.fixture(scope="module")
+def _module_media_player(fake_vlc, temp_config_file, temp_music_folder):
+    """MediaPlayer built once per module on the session's fake VLC"""
+    player = MediaPlayer(music_folder=temp_music_folder, config_file=temp_config_file)
+    yield player
+    player.cleanup()
+
+
+@pytest.fixture
+def shared_media_player(_module_media_player):
+    """Module-wide MediaPlayer shared by read-only tests
+
+    Tests using this fixture must not start playback or change volume; use
+    mocked_media_player for tests that drive the player.
+    """
+    assert _module_media_player.get_status().state == PlayerState.STOPPED
+    return _module_media_player
 
 
 class TestMediaPlayerInitialization:
     """Test MediaPlayer initialization"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_media_player_init_success(
-        self, mock_vlc, temp_config_file, temp_music_folder
-    ):
+    def test_media_player_init_success(self, mocked_media_player):
         """Test successful MediaPlayer initialization"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = mocked_media_player
 
         assert player is not None
         assert player.config_manager is not None
         assert player.spotify_client is None  # Spotify removed
 
-    @patch("media_player.VLC_AVAILABLE", False)
-    def test_media_player_init_no_vlc(self, temp_config_file, temp_music_folder):
+    def test_media_player_init_no_vlc(
+        self, monkeypatch, temp_config_file, temp_music_folder
+    ):
         """Test MediaPlayer initialization without VLC"""
+        monkeypatch.setattr(media_player, "VLC_AVAILABLE", False)
         with pytest.raises(RuntimeError, match="VLC library not available"):
             MediaPlayer(music_folder=temp_music_folder, config_file=temp_config_file)
 
@@ -42,57 +64,36 @@ class TestMediaPlayerInitialization:
 class TestMediaPlayerCore:
     """Test core MediaPlayer functionality"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_get_media_objects(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_get_media_objects(self, shared_media_player):
         """Test getting media objects"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = shared_media_player
 
         media_objects = player.get_media_objects()
         assert isinstance(media_objects, dict)
 
-        # Debug: print what we actually got
-        print(f"Media objects found: {len(media_objects)}")
-        for media_id, media_obj in media_objects.items():
-            print(f"  - {media_id}: {media_obj.name} ({media_obj.media_type})")
-
         # Should have at least some media objects
         assert len(media_objects) >= 0  # Changed to >= 0 since config might be empty
 
-        # Check that test station is present
-        test_station_found = False
-        for media_id, media_obj in media_objects.items():
-            if media_obj.name == "Test Station":
-                test_station_found = True
-                assert media_obj.media_type == MediaType.RADIO
-                break
-
         # Should find the test station from temp config
-        assert test_station_found, "Test station not found in media objects"
+        test_station = next(
+            (obj for obj in media_objects.values() if obj.name == "Test Station"),
+            None,
+        )
+        assert test_station is not None, (
+            f"Test station not found in media objects, saw: "
+            f"{[obj.name for obj in media_objects.values()]}"
+        )
+        assert test_station.media_type == MediaType.RADIO
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_get_media_object(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_get_media_object(self, shared_media_player):
         """Test getting a specific media object"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = shared_media_player
 
         media_objects = player.get_media_objects()
 
         # Get first media object
         if media_objects:
-            first_id = list(media_objects.keys())[0]
+            first_id = first(media_objects)
             media_obj = player.get_media_object(first_id)
             assert media_obj is not None
             assert media_obj.id == first_id
@@ -101,21 +102,9 @@ class TestMediaPlayerCore:
         non_existent = player.get_media_object("non_existent_id")
         assert non_existent is None
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_get_status(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_get_status(self, mocked_media_player):
         """Test getting player status"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_instance.media_player_new.return_value = mock_player
-        mock_player.get_state.return_value = 1  # Stopped state
-        mock_player.audio_get_volume.return_value = 50
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = mocked_media_player
 
         status = player.get_status()
         assert status is not None
@@ -128,108 +117,63 @@ class TestMediaPlayerCore:
 class TestMediaPlayerPlayback:
     """Test MediaPlayer playback functionality"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_play_media_radio(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_play_media_radio(self, mocked_media_player):
         """Test playing a radio station"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_media = Mock()
-
-        mock_instance.media_player_new.return_value = mock_player
-        mock_instance.media_new.return_value = mock_media
-        mock_player.play.return_value = 0  # Success
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = mocked_media_player
 
         # Get a radio station to play
         media_objects = player.get_media_objects()
-        radio_station = None
-        for media_id, media_obj in media_objects.items():
-            if media_obj.media_type == MediaType.RADIO:
-                radio_station = media_id
-                break
+        radio_station = next(
+            (
+                mid
+                for mid, obj in media_objects.items()
+                if obj.media_type == MediaType.RADIO
+            ),
+            None,
+        )
 
         if radio_station:
             result = player.play_media(radio_station)
             # Note: This might fail in test environment, but should not raise exception
             assert isinstance(result, bool)
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_volume_control(self, mock_vlc, temp_config_file, temp_music_folder):
-        """Test volume control"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_instance.media_player_new.return_value = mock_player
-        mock_player.audio_set_volume.return_value = 0  # Success
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
-
-        # Test setting volume
-        result = player.set_volume(0.5)
-        assert isinstance(result, bool)
-
-        # Test invalid volume values
-        result_low = player.set_volume(-0.1)
-        result_high = player.set_volume(1.1)
-        # Should handle gracefully
-        assert isinstance(result_low, bool)
-        assert isinstance(result_high, bool)
-
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_playback_controls(self, mock_vlc, temp_config_file, temp_music_folder):
-        """Test playback control methods"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_instance.media_player_new.return_value = mock_player
-        mock_player.stop.return_value = None
-        mock_player.pause.return_value = None
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
-
-        # Test stop
-        result = player.stop()
-        assert isinstance(result, bool)
-
-        # Test pause
-        result = player.pause()
-        assert isinstance(result, bool)
-
-        # Test resume
-        result = player.resume()
-        assert isinstance(result, bool)
+    def test_status_change_callback(self, mocked_media_player):
+        """Test playback controls push the new status to registered callbacks"""
+        statuses = []
+        mocked_media_player.add_status_change_callback(statuses.append)
+
+        mocked_media_player.set_volume(0.5)
+        mocked_media_player.stop()
+        assert [status.state for status in statuses] == [PlayerState.STOPPED] * 2
+
+        mocked_media_player.remove_status_change_callback(statuses.append)
+        mocked_media_player.stop()
+        assert len(statuses) == 2
+
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("stop", ()),
+            ("pause", ()),
+            ("resume", ()),
+            ("next_track", ()),
+            ("previous_track", ()),
+            ("set_volume", (0.5,)),
+            ("set_volume", (-0.1,)),  # out of range, handled gracefully
+            ("set_volume", (1.1,)),
+        ],
+    )
+    def test_controls_return_bool(self, mocked_media_player, method, args):
+        """Test playback, track and volume controls report success as a bool"""
+        assert isinstance(getattr(mocked_media_player, method)(*args), bool)
 
 
 class TestMediaPlayerSpotifyCompatibility:
     """Test Spotify compatibility methods (should be disabled)"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_spotify_methods_disabled(
-        self, mock_vlc, temp_config_file, temp_music_folder
-    ):
+    def test_spotify_methods_disabled(self, shared_media_player):
         """Test that Spotify methods are disabled but don't break"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = shared_media_player
 
         # Test search returns empty
         results = player.search_spotify_albums("test query")
@@ -250,131 +194,59 @@ class TestMediaPlayerSpotifyCompatibility:
 class TestMediaPlayerAlbums:
     """Test album-related functionality"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_load_albums(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_load_albums(self, mocked_media_player):
         """Test loading albums from music folder"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = mocked_media_player
 
         result = player.load_albums()
         assert isinstance(result, bool)
 
-        # Check if test album was loaded
-        media_objects = player.get_media_objects()
-        album_found = False
-        for media_id, media_obj in media_objects.items():
-            if media_obj.media_type == MediaType.ALBUM:
-                album_found = True
-                break
-
         # Should find the test album we created in temp_music_folder
+        album_found = any(
+            obj.media_type == MediaType.ALBUM
+            for obj in player.get_media_objects().values()
+        )
         assert album_found, "Test album not found in media objects"
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_local_albums_disabled(self, mock_vlc, temp_music_folder):
+    def test_local_albums_disabled(
+        self, vlc_mock, local_albums_disabled_config_file, temp_music_folder
+    ):
         """Test that albums are not loaded when enable_local_albums is False"""
-        # Create config with local albums disabled
-        config_data = {
-            "media_config": {
-                "music_folder": "music",
-                "enable_local_albums": False,
-                "enable_spotify": False,
-                "enable_sonos": False,
-                "sonos_speaker_ip": None,
-                "load_media_objects_file": True,
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            import json
-
-            json.dump(config_data, f)
-            temp_config_file = f.name
-
-        try:
-            # Mock VLC
-            mock_instance = Mock()
-            mock_vlc.Instance.return_value = mock_instance
-
-            player = MediaPlayer(
-                music_folder=temp_music_folder, config_file=temp_config_file
-            )
-
-            # Check that no albums were loaded despite the music folder having albums
-            media_objects = player.get_media_objects()
-            album_found = False
-            for media_id, media_obj in media_objects.items():
-                if media_obj.media_type == MediaType.ALBUM:
-                    album_found = True
-                    break
-
-            # Should NOT find any albums since enable_local_albums is False
-            assert not album_found, (
-                "Albums were loaded despite enable_local_albums being False"
-            )
-
-            # Calling load_albums() should also return False and not load anything
-            result = player.load_albums()
-            assert result is False, "load_albums() should return False when disabled"
-
-            # Verify still no albums after explicit load attempt
-            media_objects = player.get_media_objects()
-            album_count = sum(
-                1 for obj in media_objects.values() if obj.media_type == MediaType.ALBUM
-            )
-            assert album_count == 0, (
-                "Albums found after calling load_albums() when disabled"
-            )
-
-        finally:
-            # Cleanup temp config file
-            if os.path.exists(temp_config_file):
-                os.unlink(temp_config_file)
-
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_album_track_controls(self, mock_vlc, temp_config_file, temp_music_folder):
-        """Test album track control methods"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_player = Mock()
-        mock_instance.media_player_new.return_value = mock_player
-        mock_vlc.Instance.return_value = mock_instance
-
         player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
+            music_folder=temp_music_folder,
+            config_file=local_albums_disabled_config_file,
         )
 
-        # Test next track
-        result = player.next_track()
-        assert isinstance(result, bool)
+        # Should NOT find any albums since enable_local_albums is False,
+        # despite the music folder having albums
+        album_found = any(
+            obj.media_type == MediaType.ALBUM
+            for obj in player.get_media_objects().values()
+        )
+        assert not album_found, (
+            "Albums were loaded despite enable_local_albums being False"
+        )
 
-        # Test previous track
-        result = player.previous_track()
-        assert isinstance(result, bool)
+        # Calling load_albums() should also return False and not load anything
+        result = player.load_albums()
+        assert result is False, "load_albums() should return False when disabled"
+
+        # Verify still no albums after explicit load attempt
+        media_objects = player.get_media_objects()
+        album_count = sum(
+            1 for obj in media_objects.values() if obj.media_type == MediaType.ALBUM
+        )
+        assert album_count == 0, (
+            "Albums found after calling load_albums() when disabled"
+        )
 
 
 class TestMediaPlayerCleanup:
     """Test MediaPlayer cleanup"""
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_cleanup(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_cleanup(self, mocked_media_player):
         """Test cleanup method"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
-        player = MediaPlayer(
-            music_folder=temp_music_folder, config_file=temp_config_file
-        )
+        player = mocked_media_player
 
         # Should not raise exception
         player.cleanup()
@@ -382,23 +254,18 @@ class TestMediaPlayerCleanup:
         # Should be safe to call multiple times
         player.cleanup()
 
-    @patch("media_player.VLC_AVAILABLE", True)
-    @patch("media.player_core.vlc")
-    def test_destructor(self, mock_vlc, temp_config_file, temp_music_folder):
+    def test_destructor(self, vlc_mock, temp_config_file, temp_music_folder):
         """Test destructor calls cleanup"""
-        # Mock VLC
-        mock_instance = Mock()
-        mock_vlc.Instance.return_value = mock_instance
-
         player = MediaPlayer(
             music_folder=temp_music_folder, config_file=temp_config_file
         )
 
         # Mock the cleanup method to verify it's called
-        player.cleanup = Mock()
+        cleanup = Mock()
+        player.cleanup = cleanup
 
-        # Trigger destructor
+        # Trigger destructor; collect in case the player sits in a cycle
         del player
+        gc.collect()
 
-        # Cleanup should have been called
-        # Note: This test might be flaky due to garbage collection timing
+        cleanup.assert_called()
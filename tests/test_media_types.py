@@ -9,41 +9,48 @@ from media.types import (
 )
 
 
+@pytest.fixture(scope="module")
+def sample_tracks(sample_album_data):
+    """Tracks built from sample_album_data, shared read-only"""
+    return [Track(**track_data) for track_data in sample_album_data["tracks"]]
+
+
+@pytest.fixture(scope="module")
+def sample_album(sample_album_data, sample_tracks):
+    """Album built from sample_album_data, shared read-only"""
+    return Album(
+        name=sample_album_data["name"],
+        folder_name=sample_album_data["folder_name"],
+        tracks=sample_tracks,
+        track_count=sample_album_data["track_count"]
+    )
+
+
 class TestPlayerState:
     """Test PlayerState enum"""
     
-    def test_player_states(self):
-        """Test all player states are available"""
-        expected_states = ["stopped", "playing", "paused", "loading", "error"]
-        actual_states = [state.value for state in PlayerState]
-        
-        for state in expected_states:
-            assert state in actual_states
-    
-    def test_player_state_values(self):
-        """Test specific player state values"""
-        assert PlayerState.STOPPED == "stopped"
-        assert PlayerState.PLAYING == "playing"
-        assert PlayerState.PAUSED == "paused"
-        assert PlayerState.LOADING == "loading"
-        assert PlayerState.ERROR == "error"
+    @pytest.mark.parametrize("state,expected", [
+        (PlayerState.STOPPED, "stopped"),
+        (PlayerState.PLAYING, "playing"),
+        (PlayerState.PAUSED, "paused"),
+        (PlayerState.LOADING, "loading"),
+        (PlayerState.ERROR, "error"),
+    ])
+    def test_player_state_value(self, state, expected):
+        """Test each player state is available with its expected value"""
+        assert state == expected
 
 
 class TestMediaType:
     """Test MediaType enum"""
     
-    def test_media_types(self):
-        """Test all media types are available"""
-        expected_types = ["radio", "album"]
-        actual_types = [mt.value for mt in MediaType]
-        
-        for media_type in expected_types:
-            assert media_type in actual_types
-    
-    def test_media_type_values(self):
-        """Test specific media type values"""
-        assert MediaType.RADIO == "radio"
-        assert MediaType.ALBUM == "album"
+    @pytest.mark.parametrize("media_type,expected", [
+        (MediaType.RADIO, "radio"),
+        (MediaType.ALBUM, "album"),
+    ])
+    def test_media_type_value(self, media_type, expected):
+        """Test each media type is available with its expected value"""
+        assert media_type == expected
 
 
 class TestRadioStation:
@@ -94,18 +101,9 @@ class TestTrack:
 class TestAlbum:
     """Test Album model"""
     
-    def test_album_creation(self, sample_album_data):
+    def test_album_creation(self, sample_album):
         """Test creating an album"""
-        tracks = [
-            Track(**track_data) for track_data in sample_album_data["tracks"]
-        ]
-        
-        album = Album(
-            name=sample_album_data["name"],
-            folder_name=sample_album_data["folder_name"],
-            tracks=tracks,
-            track_count=sample_album_data["track_count"]
-        )
+        album = sample_album
         
         assert album.name == "Test Album"
         assert album.folder_name == "test_album"
@@ -113,16 +111,12 @@ class TestAlbum:
         assert album.track_count == 2
         assert album.album_art_path is None
     
-    def test_album_with_art(self, sample_album_data):
+    def test_album_with_art(self, sample_album_data, sample_tracks):
         """Test creating an album with album art"""
-        tracks = [
-            Track(**track_data) for track_data in sample_album_data["tracks"]
-        ]
-        
         album = Album(
             name=sample_album_data["name"],
             folder_name=sample_album_data["folder_name"],
-            tracks=tracks,
+            tracks=sample_tracks,
             track_count=sample_album_data["track_count"],
             album_art_path="/path/to/art.jpg"
         )
@@ -150,18 +144,9 @@ class TestMediaObject:
         assert media_obj.url == "http://example.com/stream.mp3"
         assert media_obj.album is None
     
-    def test_album_media_object(self, sample_album_data):
+    def test_album_media_object(self, sample_album):
         """Test creating an album media object"""
-        tracks = [
-            Track(**track_data) for track_data in sample_album_data["tracks"]
-        ]
-        album = Album(
-            name=sample_album_data["name"],
-            folder_name=sample_album_data["folder_name"],
-            tracks=tracks,
-            track_count=sample_album_data["track_count"]
-        )
-        
+        album = sample_album
         media_obj = MediaObject(
             id="test_album",
             name=album.name,
@@ -195,18 +180,9 @@ class TestPlayerStatus:
         assert status.volume == 0.5
         assert status.error_message is None
     
-    def test_player_status_playing(self, sample_album_data):
+    def test_player_status_playing(self, sample_album, sample_tracks):
         """Test player status when playing"""
-        tracks = [
-            Track(**track_data) for track_data in sample_album_data["tracks"]
-        ]
-        album = Album(
-            name=sample_album_data["name"],
-            folder_name=sample_album_data["folder_name"],
-            tracks=tracks,
-            track_count=sample_album_data["track_count"]
-        )
-        
+        album = sample_album
         media_obj = MediaObject(
             id="test_album",
             name=album.name,
@@ -218,7 +194,7 @@ class TestPlayerStatus:
         status = PlayerStatus(
             state=PlayerState.PLAYING,
             current_media=media_obj,
-            current_track=tracks[0],
+            current_track=sample_tracks[0],
             track_position=1,
             volume=0.8
         )
@@ -0,0 +1,42 @@
+"""
+Import smoke test, run first in CI with `pytest -m smoke`
+"""
+
+import pytest
+
+import media
+from media.types import MediaType as CoreMediaType
+from tests.conftest import media_type_values
+
+EXPECTED_MEDIA_TYPES = frozenset({"radio", "album"})
+
+
+@pytest.mark.smoke
+def test_all_imports():
+    """Test the compatibility imports, the app player and Pillow compositing"""
+    # The media package re-exports its public API
+    for name in media.__all__:
+        assert getattr(media, name) is not None
+
+    from media_player import MediaType
+
+    # The compatibility wrapper must re-export the same enum
+    assert MediaType is CoreMediaType
+    assert EXPECTED_MEDIA_TYPES <= media_type_values()
+
+    # Importing app builds the shared player; Spotify must be disabled on it
+    from app import media_player
+
+    assert media_player is not None
+    assert hasattr(media_player, "spotify_client")
+    assert media_player.spotify_client is None
+
+    # Overlay baking relies on Pillow alpha compositing
+    Image = pytest.importorskip("PIL.Image")
+    size = (120, 120)
+    base_image = Image.new("RGBA", size, (0, 100, 200, 255))
+    overlay_image = Image.new("RGBA", size, (255, 0, 0, 128))
+    result = Image.alpha_composite(base_image, overlay_image)
+    assert result.size == size
+    assert result.mode == "RGBA"
+    assert result.getpixel((0, 0)) == (128, 50, 100, 255)
@@ -8,6 +8,7 @@ import os
 
 from streamdeck import STREAMDECK_AVAILABLE
 from streamdeck_interface import StreamDeckController
+from tests.fakes import FakeMediaPlayer
 
 
 class TestStreamDeckAvailability:
@@ -230,9 +231,8 @@ class TestStreamDeckCarousel:
                 }
             }
 
-            # Mock media player
-            mock_player = Mock()
-            mock_player.get_media_objects.return_value = {}
+            # Media player with nothing loaded
+            mock_player = FakeMediaPlayer()
 
             carousel = CarouselManager(mock_config, mock_player)
             assert carousel is not None
@@ -8,7 +8,7 @@ Features station buttons, status display, volume control, and real-time updates.
 
 import asyncio
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
@@ -27,12 +27,33 @@ from textual.reactive import reactive
 from textual.binding import Binding
 from textual.message import Message
 
-from media_player import MediaPlayer, PlayerState, MediaType
+from media_player import MediaPlayer, PlayerState, PlayerStatus, MediaType
+
+STATUS_EMOJI = {
+    "stopped": "⏹️",
+    "playing": "▶️",
+    "paused": "⏸️",
+    "loading": "⏳",
+    "error": "❌",
+}
+
+# Volume bar for each tenth of the range, from empty to full
+VOLUME_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+
+class StatusChanged(Message):
+    """Posted when the media player reports a playback or volume change"""
+
+    def __init__(self, status: PlayerStatus):
+        super().__init__()
+        self.status = status
 
 
 class StationButton(Button):
     """Custom button for radio stations with state management"""
 
+    STATE_VARIANTS = {"playing": "success", "loading": "warning", "idle": "default"}
+
     def __init__(self, station_id: str, station_name: str, *args, **kwargs):
         super().__init__(station_name, *args, **kwargs)
         self.station_id = station_id
@@ -40,23 +61,26 @@ class StationButton(Button):
         self.is_playing = False
         self.is_loading = False
 
+    def set_state(self, state: str):
+        """Show the button as "playing", "loading" or "idle"
+
+        Skips the refresh when the button already shows that state.
+        """
+        variant = self.STATE_VARIANTS[state]
+        self.is_playing = state == "playing"
+        self.is_loading = state == "loading"
+        if self.variant == variant:
+            return
+        self.variant = variant
+        self.refresh()
+
     def set_playing(self, playing: bool):
         """Update button appearance based on playing state"""
-        self.is_playing = playing
-        if playing:
-            self.variant = "success"
-        else:
-            self.variant = "default"
-        self.refresh()
+        self.set_state("playing" if playing else "idle")
 
     def set_loading(self, loading: bool):
         """Update button appearance for loading state"""
-        self.is_loading = loading
-        if loading:
-            self.variant = "warning"
-        else:
-            self.variant = "default"
-        self.refresh()
+        self.set_state("loading" if loading else "idle")
 
 
 class StatusPanel(Static):
@@ -69,16 +93,8 @@ class StatusPanel(Static):
 
     def render(self) -> str:
         """Render the status panel content"""
-        status_emoji = {
-            "stopped": "⏹️",
-            "playing": "▶️",
-            "paused": "⏸️",
-            "loading": "⏳",
-            "error": "❌",
-        }
-
-        emoji = status_emoji.get(self.player_state, "❓")
-        volume_bars = "█" * int(self.volume * 10) + "░" * (10 - int(self.volume * 10))
+        emoji = STATUS_EMOJI.get(self.player_state, "❓")
+        volume_bars = VOLUME_BARS[min(max(int(self.volume * 10), 0), 10)]
 
         content = f"""[bold]🎵 Radio Streamer Status[/bold]
 
@@ -164,6 +180,8 @@ class RadioStreamerTUI(App):
         self.status_panel = None
         self.volume_control = None
         self.update_timer = None
+        self._last_status_key = None
+        self._current_station_id = None
 
     def compose(self) -> ComposeResult:
         """Create the UI layout"""
@@ -176,21 +194,15 @@ class RadioStreamerTUI(App):
     def create_station_panel(self) -> Container:
         """Create the station buttons panel"""
         buttons = []
-        stations = {}
 
-        # Get radio stations from media objects
+        # One button per radio station in the media objects
         for media_id, media_obj in self.media_player.get_media_objects().items():
             if media_obj.media_type == MediaType.RADIO:
-                stations[media_id] = {
-                    "name": media_obj.name,
-                    "url": media_obj.url,
-                    "description": media_obj.description,
-                }
-
-        for station_id, info in stations.items():
-            button = StationButton(station_id, info["name"], id=f"station_{station_id}")
-            self.station_buttons[station_id] = button
-            buttons.append(button)
+                button = StationButton(
+                    media_id, media_obj.name, id=f"station_{media_id}"
+                )
+                self.station_buttons[media_id] = button
+                buttons.append(button)
 
         return Container(
             Label("📻 Radio Stations:"), *buttons, classes="station-buttons"
@@ -222,13 +234,35 @@ class RadioStreamerTUI(App):
 
     def on_mount(self) -> None:
         """Setup the app after mounting"""
-        # Start periodic status updates
-        self.set_interval(0.5, self.update_status)
+        # Player actions push their status; the slow poll only catches
+        # changes VLC makes on its own, such as loading -> playing
+        self.media_player.add_status_change_callback(self._post_status_changed)
+        self.update_timer = self.set_interval(2.0, self.update_status)
         self.update_status()
 
-    def update_status(self) -> None:
+    def _post_status_changed(self, status: PlayerStatus) -> None:
+        """Forward a media player status change to the message queue"""
+        self.post_message(StatusChanged(status))
+
+    def on_status_changed(self, event: StatusChanged) -> None:
+        """Redraw from a pushed status change"""
+        self.update_status(event.status)
+
+    def update_status(self, status: Optional[PlayerStatus] = None) -> None:
         """Update the status panel with current radio state"""
-        status = self.media_player.get_status()
+        if status is None:
+            status = self.media_player.get_status()
+
+        # Nothing to redraw if the player is where the last update left it
+        status_key = (
+            status.current_media.id if status.current_media else None,
+            status.state,
+            status.volume,
+            status.error_message,
+        )
+        if status_key == self._last_status_key:
+            return
+        self._last_status_key = status_key
 
         if self.status_panel:
             # Get current media name for display
@@ -240,23 +274,22 @@ class RadioStreamerTUI(App):
             self.status_panel.volume = status.volume
             self.status_panel.error_message = status.error_message or ""
 
-        # Update station button states
-        for station_id, button in self.station_buttons.items():
-            is_current = status.current_media and status.current_media.id == station_id
-
-            if is_current:
-                if status.state == PlayerState.PLAYING:
-                    button.set_playing(True)
-                    button.set_loading(False)
-                elif status.state == PlayerState.LOADING:
-                    button.set_playing(False)
-                    button.set_loading(True)
-                else:
-                    button.set_playing(False)
-                    button.set_loading(False)
+        # Only the previous and the current station buttons can change
+        current_id = status.current_media.id if status.current_media else None
+        if current_id != self._current_station_id:
+            previous = self.station_buttons.get(self._current_station_id)
+            if previous:
+                previous.set_state("idle")
+            self._current_station_id = current_id
+
+        button = self.station_buttons.get(current_id)
+        if button:
+            if status.state == PlayerState.PLAYING:
+                button.set_state("playing")
+            elif status.state == PlayerState.LOADING:
+                button.set_state("loading")
             else:
-                button.set_playing(False)
-                button.set_loading(False)
+                button.set_state("idle")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events"""
@@ -318,6 +351,7 @@ class RadioStreamerTUI(App):
 
     def action_refresh(self) -> None:
         """Refresh the interface"""
+        self._last_status_key = None
         self.update_status()
         self.notify("Status refreshed", severity="information")
 
@@ -10,62 +10,88 @@ import importlib.util
 from pathlib import Path
 
 
-def check_test_file_structure(file_path):
-    """Check if a test file has proper structure"""
+# Scan results keyed by path, so each test file is read and parsed once
+_scan_cache = {}
+
+
+def scan_test_file(file_path):
+    """Parse a test file once, collecting test classes, test functions and imports
+    
+    Test methods are reported as ``Class.test_name``; imports made inside
+    functions are not collected.
+    """
+    key = str(file_path)
+    if key in _scan_cache:
+        return _scan_cache[key]
+    
     try:
-        with open(file_path, 'r') as f:
+        # Hand the raw bytes to the parser so it decodes the source itself
+        with open(file_path, 'rb') as f:
             content = f.read()
         
-        # Parse the AST
-        tree = ast.parse(content)
+        tree = ast.parse(content, filename=str(file_path))
         
-        # Check for test classes and functions
+        # Tests and imports live at module level (or directly in a test
+        # class), so only the top of the tree needs scanning
         test_classes = []
         test_functions = []
+        imports = []
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name.startswith('Test'):
-                test_classes.append(node.name)
-            elif isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                test_functions.append(node.name)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                if node.name.startswith('Test'):
+                    test_classes.append(node.name)
+                    for sub in node.body:
+                        if isinstance(sub, ast.FunctionDef) and sub.name.startswith('test_'):
+                            test_functions.append(f"{node.name}.{sub.name}")
+            elif isinstance(node, ast.FunctionDef):
+                if node.name.startswith('test_'):
+                    test_functions.append(node.name)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.append(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ''
+                for alias in node.names:
+                    imports.append(f"{module}.{alias.name}")
         
-        return {
+        result = {
             'file': file_path,
             'test_classes': test_classes,
             'test_functions': test_functions,
+            'imports': imports,
             'valid': len(test_classes) > 0 or len(test_functions) > 0
         }
     
     except Exception as e:
-        return {
+        result = {
             'file': file_path,
             'error': str(e),
+            'imports': [f"Error parsing imports: {e}"],
             'valid': False
         }
+    
+    _scan_cache[key] = result
+    return result
+
+
+def check_test_file_structure(file_path):
+    """Check if a test file has proper structure"""
+    return scan_test_file(file_path)
 
 
 def check_imports(file_path):
     """Check if imports in test file are valid"""
-    try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
-        tree = ast.parse(content)
-        imports = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ''
-                for alias in node.names:
-                    imports.append(f"{module}.{alias.name}")
-        
-        return imports
-    
-    except Exception as e:
-        return [f"Error parsing imports: {e}"]
+    return scan_test_file(file_path)['imports']
+
+
+def iter_test_files(test_dir):
+    """Yield the directory entries of test_*.py files in test_dir"""
+    with os.scandir(test_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith('test_') and name.endswith('.py') and entry.is_file():
+                yield entry
 
 
 def validate_test_structure():
@@ -88,14 +114,14 @@ def validate_test_structure():
             print(f"❌ {file} missing")
     
     # Check test files
-    test_files = list(test_dir.glob('test_*.py'))
+    test_files = list(iter_test_files(test_dir))
     print(f"\n📁 Found {len(test_files)} test files:")
     
     total_tests = 0
     valid_files = 0
     
     for test_file in test_files:
-        result = check_test_file_structure(test_file)
+        result = check_test_file_structure(test_file.path)
         
         if result['valid']:
             valid_files += 1
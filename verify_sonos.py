@@ -41,11 +41,8 @@ def verify_sonos():
                 )
                 logger.info(f"✓ IP: {speaker_info['ip_address']}")
 
-            # Get all media objects and filter Sonos ones
-            media_objects = player.get_media_objects()
-            sonos_media = {
-                k: v for k, v in media_objects.items() if k.startswith("sonos_")
-            }
+            # Get the Sonos favorites without copying every media object
+            sonos_media = player.get_sonos_media_objects()
 
             logger.info(f"✓ Found {len(sonos_media)} Sonos favorites:")
             for media_id, media_obj in sonos_media.items():